@@ -1,31 +1,69 @@
 # gmr/calendar.py
 
-from gmr.core_time import get_season_week, GameTime
-from gmr.constants import MONTHS
+from gmr.core_time import get_season_week
+from gmr.constants import MONTHS, CALENDAR_SINGLE_SHUFFLE
 
+import bisect
 import random
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 
 # Track tiers for clash rules
 # Big races: Cannot clash with anything
 # Medium races: Can clash with small races only  
 # Small races: Can clash with other small races
 
-BIG_RACES = ["Vallone GP", "Ardennes Endurance GP", "Autódromo General San Martín", "Union Speedway"]
-MEDIUM_RACES = ["Marblethorpe GP", "Château-des-Prés GP", "Rougemont GP", "Copper State Circuit"]
-SMALL_RACES = ["Bradley Fields", "Little Autodromo", "Circuito da Estrada Velha"]
+# Names are interned so every cached calendar shares one string per race
+BIG_RACES = [sys.intern(r) for r in ["Vallone GP", "Ardennes Endurance GP", "Autódromo General San Martín", "Union Speedway"]]
+MEDIUM_RACES = [sys.intern(r) for r in ["Marblethorpe GP", "Château-des-Prés GP", "Rougemont GP", "Copper State Circuit"]]
+SMALL_RACES = [sys.intern(r) for r in ["Bradley Fields", "Little Autodromo", "Circuito da Estrada Velha"]]
+
+# Tier bit flags, so clash rules reduce to a couple of bitwise tests
+_TIER_BIG = 4
+_TIER_MEDIUM = 2
+_TIER_SMALL = 1
+_TIER_NAMES = {_TIER_BIG: "big", _TIER_MEDIUM: "medium", _TIER_SMALL: "small"}
+
+# Tier of a new race -> mask of existing tiers it may share a week with
+# (big races never clash; at least one race in a clash must be small)
+_CLASHABLE_TIERS = {
+    _TIER_BIG: 0,
+    _TIER_MEDIUM: _TIER_SMALL,
+    _TIER_SMALL: _TIER_SMALL | _TIER_MEDIUM,
+}
+
+# Race name -> tier flag, built once so tier checks are a single dict probe
+_RACE_TIER = {r: _TIER_BIG for r in BIG_RACES}
+_RACE_TIER.update({r: _TIER_MEDIUM for r in MEDIUM_RACES})
+_RACE_TIER.update({r: _TIER_SMALL for r in SMALL_RACES})
+
+
+# Filler races and their placement windows (Americas races added from 1948)
+_FILLERS_PRE48 = (
+    "Bradley Fields", "Bradley Fields", "Bradley Fields",
+    "Little Autodromo", "Little Autodromo", "Little Autodromo",
+    "Marblethorpe GP",
+    "Château-des-Prés GP",
+)
+_FILLERS_POST48 = _FILLERS_PRE48 + (
+    "Circuito da Estrada Velha", "Circuito da Estrada Velha",
+    "Copper State Circuit",
+)
+
+_WINDOWS_PRE48 = (
+    (9, 12), (13, 16), (17, 19), (21, 24),
+    (26, 28), (29, 32), (33, 36), (37, 39),
+)
+_WINDOWS_POST48 = _WINDOWS_PRE48 + ((14, 18), (22, 26), (30, 34))
 
 
 def get_race_tier(race_name):
     """Get the tier of a race for clash calculations."""
-    if race_name in BIG_RACES:
-        return "big"
-    elif race_name in MEDIUM_RACES:
-        return "medium"
-    else:
-        return "small"
+    return _TIER_NAMES[_RACE_TIER.get(race_name, _TIER_SMALL)]
 
 
-def generate_calendar_for_year(year):
+def _generate_calendar_for_year_impl(year):
     """
     Build the season calendar for a given year.
 
@@ -38,8 +76,10 @@ def generate_calendar_for_year(year):
     - Small races: Can clash with each other
     - At least one race in a clash must be small
     
-    Returns: dict mapping week -> race_name (for single races)
+    Returns: read-only mapping week -> race_name (for single races)
              Also stores clashes in a separate structure accessed via get_clashes_for_year()
+
+    Results are cached per year, so the calendar is only built once.
     """
     rng = random.Random(year)  # deterministic per year
 
@@ -59,85 +99,93 @@ def generate_calendar_for_year(year):
 
     # Autódromo General San Martín from 1948 (Southern hemisphere = early year)
     if year >= 1948:
-        buenos_aires_pool = [w for w in range(10, 15) if w not in cal]
+        buenos_aires_pool = sorted(set(range(10, 15)) - cal.keys())
         if buenos_aires_pool:
             cal[rng.choice(buenos_aires_pool)] = "Autódromo General San Martín"
 
     # Second Vallone in late summer
-    vallone2_pool = [w for w in range(29, 37) if w not in cal]
+    vallone2_pool = sorted(set(range(29, 37)) - cal.keys())
     if vallone2_pool:
         cal[rng.choice(vallone2_pool)] = "Vallone GP"
 
     # ---- Fillers ----
-    fillers = [
-        "Bradley Fields", "Bradley Fields", "Bradley Fields",
-        "Little Autodromo", "Little Autodromo", "Little Autodromo",
-        "Marblethorpe GP",
-        "Château-des-Prés GP",
-    ]
-    
-    # Add Americas races from 1948
-    if year >= 1948:
-        fillers.extend([
-            "Circuito da Estrada Velha", "Circuito da Estrada Velha",
-            "Copper State Circuit",
-        ])
+    # Working copy, since it gets shuffled
+    fillers = list(_FILLERS_POST48 if year >= 1948 else _FILLERS_PRE48)
 
+    # Free weeks: sorted list for window slicing, set for membership
     candidates = [w for w in allowed_weeks if w not in cal]
+    candidates_set = set(candidates)
 
-    def can_clash(existing_race, new_race):
-        """Check if two races can share a week."""
-        tier1 = get_race_tier(existing_race)
-        tier2 = get_race_tier(new_race)
-        
-        # Big races never clash
-        if tier1 == "big" or tier2 == "big":
-            return False
-        
-        # At least one must be small
-        if tier1 == "small" or tier2 == "small":
-            return True
-        
-        # Two medium = no clash
-        return False
+    # Scheduled weeks kept sorted so spacing checks only look at neighbours
+    cal_weeks_sorted = sorted(cal.keys())
+
+    # Single-shuffle mode: one random week order for the whole year
+    if CALENDAR_SINGLE_SHUFFLE:
+        master_order = allowed_weeks[:]
+        rng.shuffle(master_order)
+
+    # Hot-loop lookups bound once as locals
+    race_tier = _RACE_TIER.get
+    rng_shuffle = rng.shuffle
+    bisect_left = bisect.bisect_left
+    bisect_right = bisect.bisect_right
+    insort = bisect.insort
+
+    # Scheduled weeks still open to a clash, sorted and split by tier
+    tier_weeks = {_TIER_BIG: [], _TIER_MEDIUM: [], _TIER_SMALL: []}
+    for w in cal_weeks_sorted:
+        tier_weeks[race_tier(cal[w], _TIER_SMALL)].append(w)
+
+    def drop_candidate(w):
+        """Remove a week from the free-week pool."""
+        candidates_set.discard(w)
+        candidates.pop(bisect_left(candidates, w))
 
     def take_week(min_week, max_week, event, min_gap=2):
         """Find a week for an event, possibly creating a clash."""
         # First: try to find a clean week with proper spacing
-        pool = [w for w in candidates if min_week <= w <= max_week]
-        rng.shuffle(pool)
+        if CALENDAR_SINGLE_SHUFFLE:
+            pool = [w for w in master_order
+                    if min_week <= w <= max_week and w in candidates_set]
+        else:
+            lo = bisect_left(candidates, min_week)
+            hi = bisect_right(candidates, max_week)
+            pool = candidates[lo:hi]
+            rng_shuffle(pool)
         
         for w in pool:
-            if all(abs(w - ew) >= min_gap for ew in cal.keys()):
-                candidates.remove(w)
+            i = bisect_left(cal_weeks_sorted, w)
+            left = cal_weeks_sorted[i - 1] if i else -10**9
+            right = cal_weeks_sorted[i] if i < len(cal_weeks_sorted) else 10**9
+            if w - left >= min_gap and right - w >= min_gap:
+                drop_candidate(w)
                 return w, False
         
         # Second: try to create a valid clash with an existing race
-        clash_candidates = [w for w in range(min_week, max_week + 1) 
-                          if w in cal and w not in clashes and can_clash(cal[w], event)]
-        rng.shuffle(clash_candidates)
+        allowed = _CLASHABLE_TIERS[race_tier(event, _TIER_SMALL)]
+        clash_candidates = []
+        for tier, weeks in tier_weeks.items():
+            if tier & allowed:
+                lo = bisect_left(weeks, min_week)
+                hi = bisect_right(weeks, max_week)
+                clash_candidates.extend(weeks[lo:hi])
+        clash_candidates.sort()
+        rng_shuffle(clash_candidates)
         
         if clash_candidates:
             return clash_candidates[0], True
         
         # Fallback: any free week
         for w in pool:
-            if w in candidates:
-                candidates.remove(w)
+            if w in candidates_set:
+                drop_candidate(w)
                 return w, False
         
         return None, False
 
-    # Placement windows
-    placement_windows = [
-        (9, 12), (13, 16), (17, 19), (21, 24),
-        (26, 28), (29, 32), (33, 36), (37, 39),
-    ]
-    
-    if year >= 1948:
-        placement_windows.extend([(14, 18), (22, 26), (30, 34)])
+    placement_windows = _WINDOWS_POST48 if year >= 1948 else _WINDOWS_PRE48
 
-    rng.shuffle(fillers)
+    rng_shuffle(fillers)
     
     for i, event in enumerate(fillers):
         window = placement_windows[i % len(placement_windows)]
@@ -145,6 +193,7 @@ def generate_calendar_for_year(year):
         
         if w is None and candidates:
             w = candidates.pop(0)
+            candidates_set.discard(w)
             is_clash = False
         
         if w is not None:
@@ -152,13 +201,21 @@ def generate_calendar_for_year(year):
                 existing = cal[w]
                 clashes[w] = [existing, event]
                 # Keep the "primary" race in cal for backwards compatibility
+                tier_weeks[race_tier(existing, _TIER_SMALL)].remove(w)
             else:
                 cal[w] = event
+                insort(cal_weeks_sorted, w)
+                insort(tier_weeks[race_tier(event, _TIER_SMALL)], w)
 
     # Store clashes globally for this year (hacky but simple)
     _year_clashes[year] = clashes
 
-    return dict(sorted(cal.items()))
+    # cal_weeks_sorted already holds every scheduled week in order
+    return MappingProxyType({w: sys.intern(cal[w]) for w in cal_weeks_sorted})
+
+
+# Deterministic per year, so build each season once and share it
+generate_calendar_for_year = lru_cache(maxsize=16)(_generate_calendar_for_year_impl)
 
 
 # Global storage for clashes by year
@@ -175,15 +232,8 @@ def format_week_date(time, season_week):
     Convert a season-week number into the month/week display
     using the time object.
     """
-    temp = GameTime(time.year)
-    temp.month = 0
-    temp.week = 1
-    temp.absolute_week = 1
-
-    for _ in range(season_week - 1):
-        temp.advance_week()
-
-    return f"Week {temp.week}, {MONTHS[temp.month]}"
+    month, week = time.week_table[max(season_week, 0)]
+    return f"Week {week}, {MONTHS[month]}"
 
 
 def show_calendar(state, time, race_calendar):
@@ -193,17 +243,21 @@ def show_calendar(state, time, race_calendar):
     current_season_week = get_season_week(time)
     clashes = get_clashes_for_year(time.year)
 
-    print("\n=== Season Calendar ===")
-    print(f"Year: {time.year}")
-    print("------------------------")
+    # Build the whole listing, then write it in one go
+    out = ["\n=== Season Calendar ===", f"Year: {time.year}", "------------------------"]
 
     # Collect all race weeks (including clash weeks)
-    all_weeks = set(race_calendar.keys()) | set(clashes.keys())
+    all_weeks = sorted(race_calendar.keys() | clashes.keys())
+    week_dates = {w: format_week_date(time, w) for w in all_weeks}
+
+    completed = state.completed_races
+    podiums = state.podiums
+    pending = state.pending_race_week
 
-    for week in sorted(all_weeks):
+    for week in all_weeks:
         # Check if this week has a clash
-        if week in clashes:
-            clash_races = clashes[week]
+        clash_races = clashes.get(week)
+        if clash_races:
             race_display = f"{clash_races[0]} OR {clash_races[1]}"
             is_clash = True
         else:
@@ -211,30 +265,26 @@ def show_calendar(state, time, race_calendar):
             is_clash = False
 
         # Status
-        if week in state.completed_races:
-            podium = state.podiums.get(week)
+        if week in completed:
+            podium = podiums.get(week)
             if podium:
-                labels = []
-                for idx, (name, ctor) in enumerate(podium, start=1):
-                    labels.append(f"P{idx} {name} ({ctor})")
-                status = ", ".join(labels)
+                status = ", ".join(f"P{idx} {name} ({ctor})"
+                                   for idx, (name, ctor) in enumerate(podium, start=1))
             else:
                 status = "Completed"
-        elif state.pending_race_week == week and week == current_season_week:
+        elif pending == week and week == current_season_week:
             status = "Race this week"
         else:
             status = "Upcoming"
             if is_clash:
                 status = "CHOOSE ONE"
 
-        date_label = format_week_date(time, week)
-        
-        if is_clash:
-            print(f"{date_label}: ⚔️ {race_display}  [{status}]")
-        else:
-            print(f"{date_label}: {race_display}  [{status}]")
+        marker = "⚔️ " if is_clash else ""
+        out.append(f"{week_dates[week]}: {marker}{race_display}  [{status}]")
+
+    out.append("------------------------")
+    out.append("Non-race weeks are not shown.")
+    if clashes:
+        out.append("⚔️ = Schedule clash — you must choose one race")
 
-    print("------------------------")
-    print("Non-race weeks are not shown.")
-    if any(clashes):
-        print("⚔️ = Schedule clash — you must choose one race")
+    print("\n".join(out))
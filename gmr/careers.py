@@ -1,17 +1,19 @@
 # gmr/careers.py
+import heapq
 import random
-from copy import deepcopy
+from functools import lru_cache
 
 
-from gmr.data import drivers
+from gmr.data import drivers, tracks
 from gmr.world_logic import (
     describe_career_phase,
     can_team_sign_driver,
     get_regen_age_for_year,
     get_retirement_ages_for_year,
 )
-# Snapshot the initial driver list so we can restore it later
-STARTING_DRIVERS = deepcopy(drivers)
+# Snapshot the initial driver list so we can restore it later.
+# Driver records only hold scalars, so a shallow dict copy is a full copy.
+STARTING_DRIVERS = [dict(d) for d in drivers]
 
 
 def reset_driver_pool():
@@ -20,10 +22,70 @@ def reset_driver_pool():
     Used when starting a brand-new career after bankruptcy or from menu.
     """
     drivers.clear()
-    drivers.extend(deepcopy(STARTING_DRIVERS))
+    drivers.extend(dict(d) for d in STARTING_DRIVERS)
 
 
+def group_drivers_by_constructor():
+    """
+    Bucket the global driver pool by constructor in a single pass.
+    Built per call rather than kept as a live index, since constructors
+    are reassigned from all over the game.
+    """
+    by_team = {}
+    for d in drivers:
+        by_team.setdefault(d.get("constructor"), []).append(d)
+    return by_team
+
+
+def driver_stat_sum(d):
+    """
+    Sum of the five core driving stats, used to price contracts.
+    Cached on the driver as "_stat_sum"; anything that changes a stat
+    must pop that key.
+    """
+    total = d.get("_stat_sum")
+    if total is None:
+        total = d["_stat_sum"] = (
+            d["pace"]
+            + d["consistency"]
+            + d["aggression"]
+            + d["mechanical_sympathy"]
+            + d["wet_skill"]
+        )
+    return total
+
+
+# Stats that XP can improve before a driver's peak
+GROWTH_STATS = ("pace", "consistency", "wet_skill", "mechanical_sympathy")
+
+# For each 4-bit mask over GROWTH_STATS, the indices of its set bits
+_GROWTH_BITS = tuple(
+    tuple(i for i in range(len(GROWTH_STATS)) if mask >> i & 1)
+    for mask in range(1 << len(GROWTH_STATS))
+)
+
+
+def _growth_mask(d):
+    """Bit i is set when GROWTH_STATS[i] can still improve (below 10)."""
+    get = d.get
+    return (
+        (get("pace", 0) < 10)
+        | (get("consistency", 0) < 10) << 1
+        | (get("wet_skill", 0) < 10) << 2
+        | (get("mechanical_sympathy", 0) < 10) << 3
+    )
+
+# Stats that can fade with age over the offseason
+AGEING_STATS = (
+    "pace",
+    "consistency",
+    "aggression",
+    "mechanical_sympathy",
+    "wet_skill",
+)
+
 
+@lru_cache(maxsize=128)
 def era_fame_scale(year: int) -> float:
     if year <= 1951:
         return 0.35
@@ -97,8 +159,10 @@ def maybe_refill_valdieri_drivers(state, time):
     if not getattr(state, "valdieri_active", False):
         return
 
+    by_team = group_drivers_by_constructor()
+
     # Current Valdieri roster
-    valdieri_drivers = [d for d in drivers if d.get("constructor") == team]
+    valdieri_drivers = by_team.get(team, [])
     needed = 2 - len(valdieri_drivers)
 
     if needed <= 0:
@@ -106,9 +170,7 @@ def maybe_refill_valdieri_drivers(state, time):
 
     # Candidate pool: Independent only (don't steal player)
     candidates = []
-    for d in drivers:
-        if d.get("constructor") != "Independent":
-            continue
+    for d in by_team.get("Independent", []):
         if state.player_driver is d:
             continue
 
@@ -132,25 +194,24 @@ def maybe_refill_valdieri_drivers(state, time):
 
         candidates.append((s, d))
 
-    candidates.sort(key=lambda x: x[0], reverse=True)
-
     if not candidates:
         state.news.append(f"{team} search for replacements, but cannot secure a driver.")
         return
 
+    # Only the best few matter, so no need to sort the whole pool
+    top = heapq.nlargest(needed, candidates, key=lambda x: x[0])
+
     signed_names = []
-    for _ in range(needed):
-        if not candidates:
-            break
+    picked_ids = set()  # skip drivers already signed (same object listed twice)
+    for _, pick in top:
+        if id(pick) in picked_ids:
+            continue
 
-        pick = candidates.pop(0)[1]
+        picked_ids.add(id(pick))
         old_team = pick.get("constructor", "Independent")
         pick["constructor"] = team
         signed_names.append(pick["name"])
 
-        # Remove duplicates of the same object if they exist
-        candidates = [(s, drv) for (s, drv) in candidates if drv is not pick]
-
     if signed_names:
         if len(signed_names) == 1:
             state.news.append(
@@ -163,76 +224,90 @@ def maybe_refill_valdieri_drivers(state, time):
 
 
 
-def update_fame_after_race(finishers, fame_mult=1.0, race_name=None, season_week=None, year=None):
+def apply_post_race_effects(state, finishers, dnf_drivers=(), fame_mult=1.0, xp_mult=1.0,
+                            race_name=None, season_week=None, year=None,
+                            apply_fame=True, apply_xp=True):
     """
-    Fame:
+    Post-race fame and XP in a single pass over the finishers, then
+    participation XP for the DNFs.
+
+    Fame (finishers only):
       - NEW: all classified finishers gain a tiny amount (era-scaled)
       - podiums still matter most
       - era scaling dampens early decades
       - soft cap slows growth as fame rises
       - track fame_cap stops small events boosting already-known drivers
+
+    XP: finishers earn by position, DNFs get participation XP only (Rule B).
+    Banked XP converts into occasional stat gains before peak_age.
+
+    Returns: (player_xp_gain, player_xp_gain_extra) for finishers / DNFs.
     """
     if year is None:
         year = 1947
 
-    scale = era_fame_scale(year)
+    player = state.player_driver if state is not None else None
+    player_xp_gain = 0.0
+    player_xp_gain_extra = 0.0
 
-    # Track-specific fame cap (None = normal 0–5 behaviour)
-    track_cap = None
-    if race_name:
-        from gmr.data import tracks  # local import to avoid circulars
-        track_cap = tracks.get(race_name, {}).get("fame_cap", None)
+    # Events that award nothing skip their pass entirely
+    scale = era_fame_scale(year)
+    if fame_mult * scale <= 1e-6:
+        apply_fame = False
+    if xp_mult <= 0:
+        apply_xp = False
+    if not (apply_fame or apply_xp):
+        return player_xp_gain, player_xp_gain_extra
 
-    for pos, (d, _) in enumerate(finishers):
-        old_fame = float(d.get("fame", 0.0))
+    if apply_fame:
 
-        # If the event is capped and you're already "too known", it stops moving the needle
-        if track_cap is not None and old_fame >= float(track_cap):
-            continue
+        # Track-specific fame cap (None = normal 0–5 behaviour)
+        track_cap = None
+        if race_name:
+            track_cap = tracks.get(race_name, {}).get("fame_cap", None)
 
         # ------------------------------
-        # NEW: baseline fame for finishing
+        # Per-position gains (same for every finisher, so worked out once)
         # ------------------------------
-        # Small in 1947–51 because scale=0.35:
+        # NEW: baseline fame for finishing. Small in 1947–51 because scale=0.35:
         # base_finish_gain becomes ~0.02ish per race before softcap.
         base_finish_gain = 0.06 * fame_mult  # tune: 0.04–0.08
-        gain = base_finish_gain
 
-        # ------------------------------
-        # Podium bonuses (still the main fame driver)
-        # ------------------------------
-        if pos == 0:
-            gain += 1.0 * fame_mult
-        elif pos in (1, 2):
-            gain += 0.6 * fame_mult
-
-        # Era dampener
-        gain *= scale
+        # Podium bonuses (still the main fame driver), then era dampener
+        podium_gains = (
+            (base_finish_gain + 1.0 * fame_mult) * scale,
+            (base_finish_gain + 0.6 * fame_mult) * scale,
+            (base_finish_gain + 0.6 * fame_mult) * scale,
+        )
+        finish_gain = base_finish_gain * scale
 
-        # Soft cap (slows growth as fame rises)
-        gain *= max(0.15, 1.0 - old_fame * 0.18)
+        # Clamp globally, and to the track cap too if present
+        cap = float(track_cap) if track_cap is not None else None
+        upper = min(5.0, cap) if cap is not None else 5.0
 
-        new_fame = old_fame + gain
+    xp_mult_f = float(xp_mult)
 
-        # Clamp globally
-        new_fame = max(0.0, min(5.0, new_fame))
+    for pos, (d, _) in enumerate(finishers):
+        # ------------------------------
+        # Fame
+        # ------------------------------
+        if apply_fame:
+            old_fame = float(d.get("fame", 0.0))
 
-        # Clamp to track cap too, if present
-        if track_cap is not None:
-            new_fame = min(float(track_cap), new_fame)
+            # If the event is capped and you're already "too known", it stops moving the needle
+            if cap is None or old_fame < cap:
+                gain = podium_gains[pos] if pos < 3 else finish_gain
 
-        d["fame"] = round(new_fame, 2)
+                # Soft cap (slows growth as fame rises)
+                gain *= max(0.15, 1.0 - old_fame * 0.18)
 
+                new_fame = max(0.0, min(upper, old_fame + gain))
 
+                d["fame"] = round(new_fame, 2)
 
-def update_driver_progress(state, finishers, time, xp_mult=1.0):
-    """
-    Handle XP gains and occasional stat increases for drivers.
-    Returns: player_xp_gain (float)
-    """
-    player_xp_gain = 0.0
+        if not apply_xp:
+            continue
 
-    for pos, (d, _) in enumerate(finishers):
         place = pos + 1
 
         # ------------------------------
@@ -255,36 +330,34 @@ def update_driver_progress(state, finishers, time, xp_mult=1.0):
         base_xp = base_xp + pos_bonus + podium_bonus
 
         dev_rate = float(d.get("development_rate", 1.0))
-        xp_gain = base_xp * dev_rate * float(xp_mult)
+        xp_gain = base_xp * dev_rate * xp_mult_f
 
         d["xp"] = d.get("xp", 0.0) + xp_gain
 
         # Track player gain for the debrief
-        if state.player_driver is d:
+        if player is d:
             player_xp_gain += xp_gain
 
         # Try to convert XP into stat gains, but only before peak_age
+        age = d.get("age")
+        peak = d.get("peak_age")
         while d["xp"] >= 5.0:
-            age = d.get("age")
-            peak = d.get("peak_age")
-
             if age is None or peak is None:
                 break
 
             # No further growth once you're at/over peak age
             if age >= peak:
                 # Don't burn XP invisibly; keep it banked so it feels fair/clear
-                if state.player_driver is d:
+                if player is d:
                     state.news.append(
                         f"{d['name']} is past their peak ({age} ≥ {peak}) — experience is banked but won’t convert into stat gains."
                     )
                 break
 
-            growth_stats = ["pace", "consistency", "wet_skill", "mechanical_sympathy"]
-            candidates = [s for s in growth_stats if d.get(s, 0) < 10]
+            mask = _growth_mask(d)
 
-            if not candidates:
-                if state.player_driver is d:
+            if not mask:
+                if player is d:
                     state.news.append(
                         f"{d['name']} can’t develop further — key skills are already maxed."
                     )
@@ -293,26 +366,22 @@ def update_driver_progress(state, finishers, time, xp_mult=1.0):
             # NOW spend XP because we know we can improve something
             d["xp"] -= 5.0
 
-            stat = random.choice(candidates)
+            bits = _GROWTH_BITS[mask]
+            stat = GROWTH_STATS[bits[random.randrange(len(bits))]]
             old_val = d.get(stat, 0)
             d[stat] = old_val + 1
+            d.pop("_stat_sum", None)
 
             # If this is the player's driver, log a news item
-            if state.player_driver is d:
+            if player is d:
                 pretty_name = stat.replace("_", " ")
                 state.news.append(
                     f"Over recent outings, {d['name']} seems sharper – "
                     f"{pretty_name} improves ({old_val} → {d[stat]})."
                 )
 
-    return player_xp_gain
-
-def grant_participation_xp_for_dnfs(state, dnf_drivers, time, xp_mult=1.0):
-    """
-    Rule B: DNFs get participation XP only (no fame).
-    Returns: player_xp_gain_extra (float)
-    """
-    player_xp_gain_extra = 0.0
+    if not apply_xp:
+        return player_xp_gain, player_xp_gain_extra
 
     for d in dnf_drivers:
         base_xp = 0.1  # participation only
@@ -321,37 +390,64 @@ def grant_participation_xp_for_dnfs(state, dnf_drivers, time, xp_mult=1.0):
 
         d["xp"] = d.get("xp", 0.0) + xp_gain
 
-        if state.player_driver is d:
+        if player is d:
             player_xp_gain_extra += xp_gain
 
-        # Same conversion rules as update_driver_progress (but no result bonuses)
+        # Same conversion rules as finishers (but no result bonuses)
+        age = d.get("age")
+        peak = d.get("peak_age")
         while d["xp"] >= 5.0:
             d["xp"] -= 5.0
 
-            age = d.get("age")
-            peak = d.get("peak_age")
             if age is None or peak is None:
                 break
             if age >= peak:
                 break
 
-            growth_stats = ["pace", "consistency", "wet_skill", "mechanical_sympathy"]
-            candidates = [s for s in growth_stats if d.get(s, 0) < 10]
-            if not candidates:
+            mask = _growth_mask(d)
+            if not mask:
                 break
 
-            stat = random.choice(candidates)
+            bits = _GROWTH_BITS[mask]
+            stat = GROWTH_STATS[bits[random.randrange(len(bits))]]
             old_val = d.get(stat, 0)
             d[stat] = old_val + 1
+            d.pop("_stat_sum", None)
 
-            if state.player_driver is d:
+            if player is d:
                 pretty_name = stat.replace("_", " ")
                 state.news.append(
                     f"Despite the retirement, {d['name']} learns from the weekend – "
                     f"{pretty_name} improves ({old_val} → {d[stat]})."
                 )
 
-    return player_xp_gain_extra
+    return player_xp_gain, player_xp_gain_extra
+
+
+def update_fame_after_race(finishers, fame_mult=1.0, race_name=None, season_week=None, year=None):
+    """Fame-only pass (see apply_post_race_effects)."""
+    apply_post_race_effects(
+        None, finishers, fame_mult=fame_mult, race_name=race_name,
+        season_week=season_week, year=year, apply_xp=False,
+    )
+
+
+def update_driver_progress(state, finishers, time, xp_mult=1.0):
+    """
+    Handle XP gains and occasional stat increases for drivers.
+    Returns: player_xp_gain (float)
+    """
+    gain, _ = apply_post_race_effects(state, finishers, xp_mult=xp_mult, apply_fame=False)
+    return gain
+
+
+def grant_participation_xp_for_dnfs(state, dnf_drivers, time, xp_mult=1.0):
+    """
+    Rule B: DNFs get participation XP only (no fame).
+    Returns: player_xp_gain_extra (float)
+    """
+    _, extra = apply_post_race_effects(state, (), dnf_drivers, xp_mult=xp_mult, apply_fame=False)
+    return extra
 
 def init_driver_careers():
     """
@@ -409,6 +505,87 @@ def init_driver_careers():
         if "car_xp" not in d:
             d["car_xp"] = 0.0
 
+
+# ------------------------------
+# ERA-APPROPRIATE NAME POOLS
+# ------------------------------
+NAME_POOLS = {
+    "italian": {
+        "first": [
+            "Carlo", "Giuseppe", "Alberto", "Vittorio", "Enrico", "Luigi",
+            "Gino", "Franco", "Sergio", "Paolo", "Bruno", "Antonio",
+            "Mario", "Renato", "Piero", "Aldo",
+        ],
+        "last": [
+            "Bianchi", "Conti", "De Luca", "Moretti", "Galli", "Marini",
+            "Esposito", "Romano", "Colombo", "Serafini", "Barbieri",
+            "Valenti", "Bernardi", "Ricci", "Ferretti",
+        ],
+    },
+
+    "french": {
+        "first": [
+            "Jean", "Pierre", "Henri", "Lucien", "Marcel", "Jacques",
+            "Émile", "Roger", "Louis", "Georges", "André",
+            "Armand", "Claude",
+        ],
+        "last": [
+            "Dubois", "Morel", "Lefèvre", "Lambert", "Renaud", "Girard",
+            "Faure", "Perrin", "Marchand", "Chevalier",
+            "Delattre", "Vandermonde",
+        ],
+    },
+
+    "germanic": {
+        "first": [
+            "Hans", "Karl", "Ernst", "Wilhelm", "Otto", "Friedrich",
+            "Rudolf", "Heinz", "Kurt", "Franz",
+        ],
+        "last": [
+            "Keller", "Schneider", "Weiss", "Bauer", "Klein",
+            "Vogel", "Hartmann", "Neumann", "Hoffner", "Brandt",
+        ],
+    },
+
+    "british": {
+        "first": [
+            "John", "Jack", "Arthur", "Edward", "George", "Henry",
+            "Ronald", "Stanley", "Frederick", "Albert",
+            "Dennis", "Peter", "Norman",
+        ],
+        "last": [
+            "Hawkins", "Turner", "Collins", "Bennett", "Walker",
+            "Thompson", "Mitchell", "Baker", "Ellis",
+            "Harrison", "Caldwell", "Broome",
+        ],
+    },
+
+    "iberian": {
+        "first": [
+            "Juan", "Miguel", "Carlos", "Luis", "Manuel", "Rafael",
+        ],
+        "last": [
+            "Navarro", "Morales", "Serrano", "Domínguez",
+            "Carrasco", "Iglesias",
+        ],
+    },
+}
+
+# Flat per-pool caches so rookie generation doesn't rebuild lists
+POOL_KEYS = tuple(NAME_POOLS.keys())
+POOL_FIRST = {k: tuple(v["first"]) for k, v in NAME_POOLS.items()}
+POOL_LAST = {k: tuple(v["last"]) for k, v in NAME_POOLS.items()}
+
+# Rookie country by name pool
+COUNTRY_MAP = {
+    "italian": "Italy",
+    "french": "France",
+    "germanic": "Switzerland",  # or Germany, but Switzerland fits
+    "british": "UK",
+    "iberian": "Spain",  # or Portugal, but Spain fits
+}
+
+
 def spawn_new_rookies(state, time):
     """
     At the end of each season, introduce a few new independent drivers
@@ -430,71 +607,6 @@ def spawn_new_rookies(state, time):
     if num_new <= 0:
         return
 
-    # ------------------------------
-    # ERA-APPROPRIATE NAME POOLS
-    # ------------------------------
-    NAME_POOLS = {
-        "italian": {
-            "first": [
-                "Carlo", "Giuseppe", "Alberto", "Vittorio", "Enrico", "Luigi",
-                "Gino", "Franco", "Sergio", "Paolo", "Bruno", "Antonio",
-                "Mario", "Renato", "Piero", "Aldo",
-            ],
-            "last": [
-                "Bianchi", "Conti", "De Luca", "Moretti", "Galli", "Marini",
-                "Esposito", "Romano", "Colombo", "Serafini", "Barbieri",
-                "Valenti", "Bernardi", "Ricci", "Ferretti",
-            ],
-        },
-
-        "french": {
-            "first": [
-                "Jean", "Pierre", "Henri", "Lucien", "Marcel", "Jacques",
-                "Émile", "Roger", "Louis", "Georges", "André",
-                "Armand", "Claude",
-            ],
-            "last": [
-                "Dubois", "Morel", "Lefèvre", "Lambert", "Renaud", "Girard",
-                "Faure", "Perrin", "Marchand", "Chevalier",
-                "Delattre", "Vandermonde",
-            ],
-        },
-
-        "germanic": {
-            "first": [
-                "Hans", "Karl", "Ernst", "Wilhelm", "Otto", "Friedrich",
-                "Rudolf", "Heinz", "Kurt", "Franz",
-            ],
-            "last": [
-                "Keller", "Schneider", "Weiss", "Bauer", "Klein",
-                "Vogel", "Hartmann", "Neumann", "Hoffner", "Brandt",
-            ],
-        },
-
-        "british": {
-            "first": [
-                "John", "Jack", "Arthur", "Edward", "George", "Henry",
-                "Ronald", "Stanley", "Frederick", "Albert",
-                "Dennis", "Peter", "Norman",
-            ],
-            "last": [
-                "Hawkins", "Turner", "Collins", "Bennett", "Walker",
-                "Thompson", "Mitchell", "Baker", "Ellis",
-                "Harrison", "Caldwell", "Broome",
-            ],
-        },
-
-        "iberian": {
-            "first": [
-                "Juan", "Miguel", "Carlos", "Luis", "Manuel", "Rafael",
-            ],
-            "last": [
-                "Navarro", "Morales", "Serrano", "Domínguez",
-                "Carrasco", "Iglesias",
-            ],
-        },
-    }
-
     existing = {d["name"] for d in drivers}
     created = []
 
@@ -502,12 +614,11 @@ def spawn_new_rookies(state, time):
         # ------------------------------
         # Name generation (paired pools)
         # ------------------------------
-        pool_key = random.choice(list(NAME_POOLS.keys()))
-        pool = NAME_POOLS[pool_key]
+        pool_key = random.choice(POOL_KEYS)
+        firsts = POOL_FIRST[pool_key]
+        lasts = POOL_LAST[pool_key]
         for _ in range(10):
-            first = random.choice(pool["first"])
-            last = random.choice(pool["last"])
-            name = f"{first} {last}"
+            name = f"{random.choice(firsts)} {random.choice(lasts)}"
             if name not in existing:
                 existing.add(name)
                 break
@@ -515,14 +626,7 @@ def spawn_new_rookies(state, time):
             name = f"Rookie {year}-{i+1}"
 
         # Assign country based on pool
-        country_map = {
-            "italian": "Italy",
-            "french": "France",
-            "germanic": "Switzerland",  # or Germany, but Switzerland fits
-            "british": "UK",
-            "iberian": "Spain",  # or Portugal, but Spain fits
-        }
-        country = country_map.get(pool_key, "UK")  # default to UK
+        country = COUNTRY_MAP.get(pool_key, "UK")  # default to UK
 
         # Era-appropriate regen age
         age = get_regen_age_for_year(year)
@@ -588,19 +692,17 @@ def spawn_new_rookies(state, time):
 
 
 def offseason_fame_decay(time):
-    for d in drivers:
-        fame = float(d.get("fame", 0.0))
-
-        # Early era: reputations are more local/fragile
-        if time.year <= 1951:
-            decay = 0.25
-        else:
-            decay = 0.15
+    # Early era: reputations are more local/fragile
+    if time.year <= 1951:
+        decay = 0.25
+    else:
+        decay = 0.15
 
-        # Winners don’t fade as fast (optional hook if you track form/results)
-        # decay *= 0.8
+    # Winners don’t fade as fast (optional hook if you track form/results)
+    # decay *= 0.8
 
-        d["fame"] = round(max(0.0, fame - decay), 2)
+    for d in drivers:
+        d["fame"] = round(max(0.0, float(d.get("fame", 0.0)) - decay), 2)
 
 
 def apply_offseason_ageing_and_retirement(state, time):
@@ -616,6 +718,7 @@ def apply_offseason_ageing_and_retirement(state, time):
 
     soft_retire, hard_retire = get_retirement_ages_for_year(time.year)
     retired = []
+    rand = random.random
 
     for d in list(drivers):
         age = d.get("age")
@@ -658,26 +761,20 @@ def apply_offseason_ageing_and_retirement(state, time):
 
         # Actually APPLY the decline
         if decline_chance > 0:
-            ageing_stats = [
-                "pace",
-                "consistency",
-                "aggression",
-                "mechanical_sympathy",
-                "wet_skill",
-            ]
-
-            for key in ageing_stats:
-                if key not in d:
-                    continue
-                if d[key] <= 1:
+            getv = d.get
+            is_player = state.player_driver is d
+
+            for key in AGEING_STATS:
+                old_val = getv(key, 0)  # missing stats are skipped like maxed-down ones
+                if old_val <= 1:
                     continue
 
-                if random.random() < decline_chance:
-                    old_val = d[key]
-                    d[key] = max(1, d[key] - 1)
+                if rand() < decline_chance:
+                    d[key] = old_val - 1
+                    d.pop("_stat_sum", None)
 
                     # If it's your driver, tell you
-                    if state.player_driver is d and old_val != d[key]:
+                    if is_player:
                         pretty_name = key.replace("_", " ")
                         state.news.append(
                             f"Over the winter, {d['name']} seems to lose a touch of {pretty_name} "
@@ -701,16 +798,18 @@ def apply_offseason_ageing_and_retirement(state, time):
         if fame >= 4 and age < hard_retire + 3:
             retire_prob *= 0.5
 
-        if retire_prob > 0 and random.random() < retire_prob:
+        if retire_prob > 0 and rand() < retire_prob:
             retired.append(d)
 
     # -------------------------
     # Apply retirements
     # -------------------------
-    for d in retired:
-        if d in drivers:
-            drivers.remove(d)
+    # Drop every retiree in one sweep (in place: other modules hold this list)
+    if retired:
+        retired_ids = {id(d) for d in retired}
+        drivers[:] = [d for d in drivers if id(d) not in retired_ids]
 
+    for d in retired:
         name = d["name"]
         fame = d.get("fame", 0)
         fame_label = describe_driver_fame(fame)
@@ -743,46 +842,46 @@ def maybe_expand_enzoni_to_three_cars(state, time):
     if time.year < 1950:
         return
 
-    enzoni_drivers = [d for d in drivers if d.get("constructor") == "Enzoni"]
-    if len(enzoni_drivers) >= 3:
+    # One pass: count Enzoni seats and gather everyone they could sign
+    enzoni_count = 0
+    candidates = []
+    for d in drivers:
+        ctor = d.get("constructor")
+        if ctor == "Enzoni":
+            enzoni_count += 1
+        # Never steal from Test; everyone else is fair game
+        # (Independent, Valdieri, even the player)
+        elif ctor != "Test":
+            candidates.append(d)
+
+    if enzoni_count >= 3:
         return
 
-    # Enzoni hiring mentality: WIN NOW
-    def score(d):
-        pace = d.get("pace", 0)
-        cons = d.get("consistency", 0)
-        mech = d.get("mechanical_sympathy", 0)
-        fame = float(d.get("fame", 0.0))
+    if not candidates:
+        return
+
+    # Enzoni hiring mentality: WIN NOW (single pass, best score wins)
+    player = state.player_driver
+    pick = None
+    best_s = float("-inf")
+    for d in candidates:
+        get = d.get
 
         # Heavy emphasis on speed + reliability of performance
         s = (
-            pace * 1.6 +
-            cons * 1.4 +
-            mech * 0.3 +
-            fame * 0.35
+            get("pace", 0) * 1.6 +
+            get("consistency", 0) * 1.4 +
+            get("mechanical_sympathy", 0) * 0.3 +
+            float(get("fame", 0.0)) * 0.35
         )
 
         # Slight political friction if stealing YOUR driver (still very possible)
-        if state.player_driver is d:
+        if d is player:
             s -= 0.8
 
-        return s
-
-    candidates = []
-    for d in drivers:
-        ctor = d.get("constructor")
-
-        # Never steal from Test or duplicate Enzoni
-        if ctor in ("Enzoni", "Test"):
-            continue
-
-        # Everyone else is fair game: Independent, Valdieri, even the player
-        candidates.append(d)
-
-    if not candidates:
-        return
-
-    pick = max(candidates, key=score)
+        if s > best_s:
+            best_s = s
+            pick = d
 
     # Gate stealing the player driver so it feels dramatic, not constant
     if state.player_driver is pick:
@@ -949,7 +1048,7 @@ def show_driver_race_history(state, driver):
     # Show results grouped by year, most recent first
     results_by_year = {}
     for r in history.race_results:
-        year = r['year']
+        year = r.year
         if year not in results_by_year:
             results_by_year[year] = []
         results_by_year[year].append(r)
@@ -964,16 +1063,16 @@ def show_driver_race_history(state, driver):
         
         for r in results_by_year[year]:
             conditions = ""
-            if r['wet']:
+            if r.wet:
                 conditions = " 🌧️"
-            elif r['hot']:
+            elif r.hot:
                 conditions = " ☀️"
             
-            if r['dnf']:
-                reason_emoji = "💥" if r['dnf_reason'] == "crash" else "🔧"
-                print(f"  Week {r['week']:2}: {r['race']:<30} DNF ({r['dnf_reason']}) {reason_emoji}{conditions}")
+            if r.dnf:
+                reason_emoji = "💥" if r.dnf_reason == "crash" else "🔧"
+                print(f"  Week {r.week:2}: {r.race:<30} DNF ({r.dnf_reason}) {reason_emoji}{conditions}")
             else:
-                pos = r['position']
+                pos = r.position
                 pos_str = f"P{pos}"
                 if pos == 1:
                     pos_str = "🥇 P1"
@@ -982,8 +1081,8 @@ def show_driver_race_history(state, driver):
                 elif pos == 3:
                     pos_str = "🥉 P3"
                 
-                pts_str = f"+{r['points']}pts" if r['points'] > 0 else ""
-                print(f"  Week {r['week']:2}: {r['race']:<30} {pos_str:8} {pts_str:8} ({r['constructor']}){conditions}")
+                pts_str = f"+{r.points}pts" if r.points > 0 else ""
+                print(f"  Week {r.week:2}: {r.race:<30} {pos_str:8} {pts_str:8} ({r.constructor}){conditions}")
     
     input("\n  Press Enter to continue...")
 
@@ -1028,7 +1127,8 @@ def show_driver_market(state):
             if d["constructor"] not in ("Enzoni", "Test")
         ]
 
-        print("\nAvailable Drivers:")
+        # Build the whole list, then write it in one go
+        lines = ["\nAvailable Drivers:"]
         for idx, d in enumerate(market_drivers, start=1):
             marker = ""
             if state.player_driver is d:
@@ -1039,17 +1139,18 @@ def show_driver_market(state):
             fame_label = describe_driver_fame(fame)
             career_stage = describe_career_phase(d)
 
-            print(f"{idx}. {d['name']}{marker}")
-            print(f"   Age: {age}  Fame: {fame} ({fame_label})")
-            print(f"   Career: {career_stage}")
-            print(f"   Country: {d.get('country', 'Unknown')}")
-            print(f"   Pace: {d['pace']}  Consistency: {d['consistency']}")
-            print(
+            lines.append(f"{idx}. {d['name']}{marker}")
+            lines.append(f"   Age: {age}  Fame: {fame} ({fame_label})")
+            lines.append(f"   Career: {career_stage}")
+            lines.append(f"   Country: {d.get('country', 'Unknown')}")
+            lines.append(f"   Pace: {d['pace']}  Consistency: {d['consistency']}")
+            lines.append(
                 f"   Aggression: {d['aggression']}  "
                 f"Mech Sympathy: {d['mechanical_sympathy']}  "
                 f"Wet Skill: {d['wet_skill']}"
             )
-            print(f"   Registered constructor: {d['constructor']}")
+            lines.append(f"   Registered constructor: {d['constructor']}")
+        print("\n".join(lines))
 
         print("\n" + "-" * 40)
         print("Options:")
@@ -1159,13 +1260,7 @@ def show_driver_market(state):
             break
 
         # Calculate pay-per-race based on stats + fame
-        stat_sum = (
-            selected_driver["pace"]
-            + selected_driver["consistency"]
-            + selected_driver["aggression"]
-            + selected_driver["mechanical_sympathy"]
-            + selected_driver["wet_skill"]
-        )
+        stat_sum = driver_stat_sum(selected_driver)
         fame = selected_driver.get("fame", 0)
 
         base_pay = stat_sum * 2  # skill-based base
@@ -1228,21 +1323,24 @@ def show_driver_market(state):
         input("\nPress Enter to return to the main menu...")
         return
 
+# Indexed by whole fame points; 4.0 and above are all "International name"
+_FAME_LABELS = (
+    "Unknown privateer",
+    "Locally known",
+    "Known in the paddock",
+    "Respected contender",
+    "International name",
+)
+
+
 def describe_driver_fame(fame: float) -> str:
     """
     Fame is a 0.0–5.0 float.
     These labels are UI only.
     """
     if fame < 1.0:
-        return "Unknown privateer"
-    elif fame < 2.0:
-        return "Locally known"
-    elif fame < 3.0:
-        return "Known in the paddock"
-    elif fame < 4.0:
-        return "Respected contender"
-    else:
-        return "International name"
+        return _FAME_LABELS[0]
+    return _FAME_LABELS[min(int(fame), 4)]
 
 
 
@@ -1310,13 +1408,7 @@ def maybe_offer_driver_extension(state, time):
         break
 
     # Recalculate pay-per-race
-    stat_sum = (
-        d["pace"]
-        + d["consistency"]
-        + d["aggression"]
-        + d["mechanical_sympathy"]
-        + d["wet_skill"]
-    )
+    stat_sum = driver_stat_sum(d)
     fame = d.get("fame", 0)
 
     base_pay = stat_sum * 2
@@ -1,5 +1,7 @@
 # gmr/constants.py
-
+import sys
+from bisect import bisect_right
+from functools import lru_cache
 
 
 MONTHS = [
@@ -20,6 +22,7 @@ SPONSOR_TRIGGER_RACE_WEEK = 20  # Vallone GP
 ENZONI_PRESTIGE_REQUIREMENT = 5.0  # minimum team prestige to unlock Enzoni customer engines
 CHAMPIONSHIP_ACTIVE = False
 TEST_DRIVERS_ENABLED = False  # Patch F: keep Test archetypes out of real seasons
+CALENDAR_SINGLE_SHUFFLE = False  # one week shuffle per year; changes every calendar, so off for existing saves
 # --- Debug / dev toggles ---
 DEBUG_MODE = True          # set False for "release-like" behaviour
 PAUSE_ON_CRASH = True      # when DEBUG_MODE, pause so console doesn't vanish
@@ -41,25 +44,83 @@ PRIZE_RULES = {
     "Vallone GP": {"top3": [500, 250, 100], "finisher_bonus": 50},
     "Ardennes Endurance GP": {"top3": [800, 500, 300], "finisher_bonus": 100},
 }
+# Calendar race names are interned, so interned keys match by identity
+PRIZE_RULES = {sys.intern(name): rule for name, rule in PRIZE_RULES.items()}
+
+# Prize per finishing position for each race, padded with the finisher
+# bonus so most lookups are a single tuple index.
+_PRIZE_TABLE_LEN = 25
+
+
+def _flat_prizes(top3, finisher_bonus):
+    row = tuple(int(p) for p in top3)
+    return row + (int(finisher_bonus),) * (_PRIZE_TABLE_LEN - len(row))
+
+
+_FLAT_PRIZES = {
+    name: _flat_prizes(rule.get("top3", DEFAULT_PRIZE_TOP3), rule.get("finisher_bonus", 0))
+    for name, rule in PRIZE_RULES.items()
+    if rule
+}
+_DEFAULT_FLAT_PRIZES = _flat_prizes(DEFAULT_PRIZE_TOP3, 0)
+
 
 def get_prize_for_race_and_pos(race_name: str, pos_index: int) -> int:
     """
     pos_index is 0-based (0=winner, 1=P2, 2=P3, 3=P4, etc).
     Returns the organiser prize for that finishing position.
     """
-    rule = PRIZE_RULES.get(race_name)
-    if not rule:
-        # fallback to old behavior
-        return DEFAULT_PRIZE_TOP3[pos_index] if pos_index < len(DEFAULT_PRIZE_TOP3) else 0
-
-    top3 = rule.get("top3", DEFAULT_PRIZE_TOP3)
-    finisher_bonus = int(rule.get("finisher_bonus", 0))
+    row = _FLAT_PRIZES.get(race_name, _DEFAULT_FLAT_PRIZES)
+    if pos_index < _PRIZE_TABLE_LEN:
+        return row[pos_index]
+    # Beyond the table everyone gets the finisher bonus (if any)
+    return row[-1]
 
-    if pos_index < len(top3):
-        return int(top3[pos_index])
 
-    # 4th+ get finisher bonus (if any)
-    return finisher_bonus
+# ------------------------------
+# Era tables
+# ------------------------------
+# Every era-based lookup shares one set of band boundaries. Band 0 is
+# before 1950; band i covers _ERA_YEARS[i-1] <= year < _ERA_YEARS[i].
+_ERA_YEARS = (1950, 1955, 1960, 1965, 1970, 1980, 1985, 1990, 2000, 2010, 2020, 2025)
+
+#                <50  50   55   60   65   70   80   85   90   00   10   20   25+
+_RELIABILITY = (2.5, 2.5, 2.0, 2.0, 1.5, 1.5, 1.2, 1.2, 1.2, 1.0, 1.0, 0.8, 0.8)
+_CRASH       = (1.5, 1.5, 1.3, 1.3, 1.3, 1.1, 1.1, 1.0, 1.0, 0.9, 0.9, 1.0, 1.0)
+_SPEED       = (1.0, 1.1, 1.1, 1.25, 1.25, 1.4, 1.6, 1.6, 1.8, 2.0, 2.1, 2.3, 2.3)
+_ERA_OF_BAND = (0,   1,   1,   2,   2,   3,   4,   4,   5,   6,   7,   8,   9)
+
+_ERA_NAMES = (
+    "Post-War Revival",
+    "Golden Age",
+    "Sponsorship Era",
+    "Ground Effect Era",
+    "Turbo Era",
+    "High-Tech Era",
+    "Aero Dominance",
+    "Hybrid Era",
+    "Sustainable Era",
+    "Future Racing",
+)
+
+_ERA_DESCRIPTIONS = (
+    "Grids rebuilt from pre-war remnants. Passion over technology.",
+    "Front-engined roadsters rule. Privateers thrive alongside works teams.",
+    "Rear engines revolutionize racing. Commercial sponsorship arrives.",
+    "Aerodynamic ground effect changes everything. Danger peaks then regulations tighten.",
+    "Turbochargers deliver incredible power. Electronics begin to influence racing.",
+    "Active suspension and traction control emerge. Costs spiral upward.",
+    "Aerodynamics dominate car design. Overtaking becomes difficult.",
+    "Hybrid power units arrive. Efficiency matters alongside speed.",
+    "Sustainable fuels and reduced emissions. Racing adapts to a changing world.",
+    "Autonomous assistance systems and electric hybrids. The future of racing.",
+)
+
+
+@lru_cache(maxsize=128)
+def _era_idx(year):
+    """Band index into the era tables for a year."""
+    return bisect_right(_ERA_YEARS, year)
 
 
 def get_reliability_mult(time):
@@ -67,86 +128,24 @@ def get_reliability_mult(time):
     Reliability improves over the decades as engineering matures.
     Lower = more reliable.
     """
-    year = time.year
-    if year < 1955:
-        return 2.5  # Early era: very unreliable
-    elif year < 1965:
-        return 2.0  # 1950s-60s: improving
-    elif year < 1980:
-        return 1.5  # 1970s: better engineering
-    elif year < 2000:
-        return 1.2  # 1980s-90s: modern reliability
-    elif year < 2020:
-        return 1.0  # 2000s-2010s: highly reliable
-    else:
-        return 0.8  # 2020s: cutting-edge reliability
+    return _RELIABILITY[_era_idx(time.year)]
 
 
 def get_crash_mult(time):
     """
     Crash rates decline as safety improves, but later eras push limits again.
     """
-    year = time.year
-    if year < 1955:
-        return 1.5  # Early era: dangerous
-    elif year < 1970:
-        return 1.3  # 1960s: still risky
-    elif year < 1985:
-        return 1.1  # 1970s-80s: safety improvements
-    elif year < 2000:
-        return 1.0  # 1990s: modern safety
-    elif year < 2020:
-        return 0.9  # 2000s-2010s: very safe
-    else:
-        return 1.0  # 2020s: pushing limits again with speed
+    return _CRASH[_era_idx(time.year)]
 
 
 def get_era_name(year):
     """Get the name of the current racing era."""
-    if year < 1950:
-        return "Post-War Revival"
-    elif year < 1960:
-        return "Golden Age"
-    elif year < 1970:
-        return "Sponsorship Era"
-    elif year < 1980:
-        return "Ground Effect Era"
-    elif year < 1990:
-        return "Turbo Era"
-    elif year < 2000:
-        return "High-Tech Era"
-    elif year < 2010:
-        return "Aero Dominance"
-    elif year < 2020:
-        return "Hybrid Era"
-    elif year < 2025:
-        return "Sustainable Era"
-    else:
-        return "Future Racing"
+    return _ERA_NAMES[_ERA_OF_BAND[_era_idx(year)]]
 
 
 def get_era_description(year):
     """Get a description of the current era's characteristics."""
-    if year < 1950:
-        return "Grids rebuilt from pre-war remnants. Passion over technology."
-    elif year < 1960:
-        return "Front-engined roadsters rule. Privateers thrive alongside works teams."
-    elif year < 1970:
-        return "Rear engines revolutionize racing. Commercial sponsorship arrives."
-    elif year < 1980:
-        return "Aerodynamic ground effect changes everything. Danger peaks then regulations tighten."
-    elif year < 1990:
-        return "Turbochargers deliver incredible power. Electronics begin to influence racing."
-    elif year < 2000:
-        return "Active suspension and traction control emerge. Costs spiral upward."
-    elif year < 2010:
-        return "Aerodynamics dominate car design. Overtaking becomes difficult."
-    elif year < 2020:
-        return "Hybrid power units arrive. Efficiency matters alongside speed."
-    elif year < 2025:
-        return "Sustainable fuels and reduced emissions. Racing adapts to a changing world."
-    else:
-        return "Autonomous assistance systems and electric hybrids. The future of racing."
+    return _ERA_DESCRIPTIONS[_ERA_OF_BAND[_era_idx(year)]]
 
 
 def get_era_speed_factor(year):
@@ -154,24 +153,7 @@ def get_era_speed_factor(year):
     Speed factor increases over time as cars get faster.
     Affects lap times, pursuit gaps, etc.
     """
-    if year < 1950:
-        return 1.0
-    elif year < 1960:
-        return 1.1
-    elif year < 1970:
-        return 1.25
-    elif year < 1980:
-        return 1.4
-    elif year < 1990:
-        return 1.6
-    elif year < 2000:
-        return 1.8
-    elif year < 2010:
-        return 2.0
-    elif year < 2020:
-        return 2.1
-    else:
-        return 2.3  # Futuristic speed
+    return _SPEED[_era_idx(year)]
 
 
 # Garage upgrade system
@@ -232,54 +214,78 @@ GARAGE_UPGRADES = {
 }
 
 
+# Flat per-upgrade tables built once from GARAGE_UPGRADES. Each upgrade id
+# gets one bit so ownership and prerequisites can be checked with a mask.
+_UPGRADE_IDS = tuple(GARAGE_UPGRADES)
+_UPGRADE_INDEX = {upgrade_id: i for i, upgrade_id in enumerate(_UPGRADE_IDS)}
+_UPGRADE_YEARS = tuple(u["year_available"] for u in GARAGE_UPGRADES.values())
+_UPGRADE_REQ_MASK = tuple(
+    sum(1 << _UPGRADE_INDEX[req] for req in u.get("requirements", ()))
+    for u in GARAGE_UPGRADES.values()
+)
+# (repair_discount, repair_speed_bonus, mechanic_skill_bonus, r_and_d_enabled)
+_UPGRADE_BENEFITS = tuple(
+    (
+        u["benefits"].get("repair_discount", 0.0),
+        u["benefits"].get("repair_speed_bonus", 0.0),
+        u["benefits"].get("mechanic_skill_bonus", 0),
+        bool(u["benefits"].get("r_and_d_enabled", False)),
+    )
+    for u in GARAGE_UPGRADES.values()
+)
+
+
+def _owned_upgrade_mask(garage):
+    """Bitmask of the known upgrades in garage.upgrades."""
+    mask = 0
+    for upgrade_id in garage.upgrades:
+        i = _UPGRADE_INDEX.get(upgrade_id)
+        if i is not None:
+            mask |= 1 << i
+    return mask
+
+
 def calculate_garage_benefits(garage):
     """
     Calculate effective garage benefits based on purchased upgrades.
     Returns a dict with total benefits.
     """
-    benefits = {
-        "repair_discount": 0.0,
-        "repair_speed_bonus": 0.0,
-        "mechanic_skill_bonus": 0,
-        "r_and_d_enabled": False,
-    }
+    discount = 0.0
+    speed = 0.0
+    skill = 0
+    r_and_d = False
 
+    # Walk in purchase order so float totals match the order they stacked in
     for upgrade_id in garage.upgrades:
-        if upgrade_id in GARAGE_UPGRADES:
-            upgrade = GARAGE_UPGRADES[upgrade_id]
-            for benefit_key, benefit_value in upgrade["benefits"].items():
-                if benefit_key in benefits:
-                    if isinstance(benefits[benefit_key], bool):
-                        benefits[benefit_key] = benefits[benefit_key] or benefit_value
-                    else:
-                        benefits[benefit_key] += benefit_value
-
-    return benefits
+        i = _UPGRADE_INDEX.get(upgrade_id)
+        if i is None:
+            continue
+        d, sp, sk, rd = _UPGRADE_BENEFITS[i]
+        discount += d
+        speed += sp
+        skill += sk
+        r_and_d = r_and_d or rd
+
+    return {
+        "repair_discount": discount,
+        "repair_speed_bonus": speed,
+        "mechanic_skill_bonus": skill,
+        "r_and_d_enabled": r_and_d,
+    }
 
 
 def get_available_garage_upgrades(garage, current_year):
     """
     Get list of upgrade IDs that are available for purchase.
     """
-    available = []
-
-    for upgrade_id, upgrade in GARAGE_UPGRADES.items():
-        # Check if already purchased
-        if upgrade_id in garage.upgrades:
-            continue
-
-        # Check year requirement
-        if current_year < upgrade["year_available"]:
-            continue
-
-        # Check prerequisites
-        requirements_met = True
-        for req in upgrade["requirements"]:
-            if req not in garage.upgrades:
-                requirements_met = False
-                break
-
-        if requirements_met:
-            available.append(upgrade_id)
-
-    return available
+    owned = _owned_upgrade_mask(garage)
+    req_masks = _UPGRADE_REQ_MASK
+    years = _UPGRADE_YEARS
+
+    return [
+        upgrade_id
+        for i, upgrade_id in enumerate(_UPGRADE_IDS)
+        if not (owned >> i) & 1
+        and current_year >= years[i]
+        and (owned & req_masks[i]) == req_masks[i]
+    ]
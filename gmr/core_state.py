@@ -1,8 +1,36 @@
 # gmr/core_state.py
 
+import random
+import sys
+from bisect import bisect_right
+from collections import namedtuple
+from operator import itemgetter
+
+from gmr.constants import calculate_garage_benefits, get_era_name
 from gmr.data import drivers
 from gmr.world_economy import WorldEconomy
 
+# Skill-driven values indexed by skill level (0-10)
+_SPONSOR_MULT = tuple(0.7 + (s * 0.055) for s in range(11))
+_PURCHASE_DISCOUNT = tuple((s - 2) * 0.02 for s in range(11))
+_MORALE_BONUS = tuple((s - 2) * 0.01 for s in range(11))
+_MECHANIC_BONUS = tuple((s - 2) * 0.1 for s in range(11))
+_XP_FOR_NEXT = tuple(level * 100 for level in range(11))
+
+# Title by age band: under 25, 25-39, 40-54, 55-69, 70+
+_AGE_TITLE_THRESHOLDS = (25, 40, 55, 70)
+_AGE_TITLES = ("Young", "", "Experienced", "Veteran", "Legendary")
+
+# Learning penalty by builds completed: first, second, third onwards
+_COMPONENT_PENALTY = (0.30, 0.15, 0.0)
+
+# (skill attribute, XP attribute, label) for each trainable skill
+_SKILL_SPECS = (
+    ("technical_knowledge", "technical_xp", "Technical knowledge"),
+    ("business", "business_xp", "Business skill"),
+    ("leadership", "leadership_xp", "Leadership skill"),
+)
+
 
 class PlayerCharacter:
     """
@@ -22,6 +50,16 @@ class PlayerCharacter:
     
     REPUTATION: Mirrors prestige/success, not a skill you train
     """
+    __slots__ = (
+        "name", "birth_year", "home_country", "personal_savings",
+        "technical_knowledge", "business", "leadership", "technical_xp",
+        "business_xp", "leadership_xp", "component_experience", "current_era",
+        "era_adaptation", "risk_tolerance", "ambition", "integrity", "patience",
+        "reputation", "health", "companies_founded", "companies_managed",
+        "career_wins", "career_podiums", "career_races", "current_role",
+        "years_in_current_role", "is_alive", "death_year", "death_reason",
+    )
+
     def __init__(self):
         self.name = "Anonymous Owner"
         self.birth_year = 1930
@@ -84,38 +122,33 @@ class PlayerCharacter:
     # === SKILL GROWTH ===
     def gain_technical_xp(self, amount, reason=""):
         """Gain technical experience. Level up when hitting threshold."""
-        self.technical_xp += amount
-        xp_needed = self._xp_for_next_level(self.technical_knowledge)
-        if self.technical_xp >= xp_needed and self.technical_knowledge < 10:
-            self.technical_xp -= xp_needed
-            self.technical_knowledge += 1
-            return f"Technical knowledge improved to {self.technical_knowledge}!"
-        return None
+        return self._gain_xp(0, amount)
     
     def gain_business_xp(self, amount, reason=""):
         """Gain business experience. Level up when hitting threshold."""
-        self.business_xp += amount
-        xp_needed = self._xp_for_next_level(self.business)
-        if self.business_xp >= xp_needed and self.business < 10:
-            self.business_xp -= xp_needed
-            self.business += 1
-            return f"Business skill improved to {self.business}!"
-        return None
+        return self._gain_xp(1, amount)
     
     def gain_leadership_xp(self, amount, reason=""):
         """Gain leadership experience. Level up when hitting threshold."""
-        self.leadership_xp += amount
-        xp_needed = self._xp_for_next_level(self.leadership)
-        if self.leadership_xp >= xp_needed and self.leadership < 10:
-            self.leadership_xp -= xp_needed
-            self.leadership += 1
-            return f"Leadership skill improved to {self.leadership}!"
+        return self._gain_xp(2, amount)
+    
+    def _gain_xp(self, skill_idx, amount):
+        """Shared XP/level-up logic for the entries in _SKILL_SPECS."""
+        skill_attr, xp_attr, label = _SKILL_SPECS[skill_idx]
+        level = getattr(self, skill_attr)
+        xp = getattr(self, xp_attr) + amount
+        xp_needed = _XP_FOR_NEXT[level]
+        if xp >= xp_needed and level < 10:
+            setattr(self, xp_attr, xp - xp_needed)
+            setattr(self, skill_attr, level + 1)
+            return f"{label} improved to {level + 1}!"
+        setattr(self, xp_attr, xp)
         return None
     
     def _xp_for_next_level(self, current_level):
         """XP required to reach next level. Higher levels need more XP."""
         # Level 2->3: 100 XP, Level 9->10: 800 XP
-        return current_level * 100
+        return _XP_FOR_NEXT[current_level]
     
     # === COMPONENT EXPERIENCE ===
     def record_component_build(self, category):
@@ -131,17 +164,11 @@ class PlayerCharacter:
         Third+: no penalty
         """
         exp = self.component_experience.get(category, 0)
-        if exp == 0:
-            return 0.30  # 30% penalty for first attempt
-        elif exp == 1:
-            return 0.15  # 15% penalty for second attempt
-        else:
-            return 0.0   # No penalty once experienced
+        return _COMPONENT_PENALTY[min(exp, 2)]
     
     # === ERA ADAPTATION ===
     def check_era_change(self, current_year):
         """Check if era changed and apply adaptation penalty if so."""
-        from gmr.constants import get_era_name
         new_era = get_era_name(current_year)
         
         if new_era != self.current_era:
@@ -156,9 +183,11 @@ class PlayerCharacter:
         """Gradually adapt to new era (call each season or after R&D)."""
         if self.era_adaptation < 1.0:
             # Gain 10% adaptation per season/major activity
-            self.era_adaptation = min(1.0, self.era_adaptation + 0.10)
-            if self.era_adaptation >= 1.0:
+            adaptation = self.era_adaptation + 0.10
+            if adaptation >= 1.0:
+                self.era_adaptation = 1.0
                 return "You've fully adapted to the new era!"
+            self.era_adaptation = adaptation
         return None
     
     def get_effective_technical(self):
@@ -169,35 +198,38 @@ class PlayerCharacter:
     def update_reputation(self, company_prestige):
         """Update reputation based on company prestige. Called periodically."""
         # Reputation trends toward company prestige but slower
-        target = max(1, company_prestige)
-        if self.reputation < target:
+        target = company_prestige if company_prestige > 1 else 1
+        reputation = self.reputation
+        if reputation < target:
             # Gain reputation slowly
-            self.reputation = min(target, self.reputation + 0.5)
-        elif self.reputation > target + 2:
+            reputation += 0.5
+            self.reputation = reputation if reputation < target else target
+        elif reputation > target + 2:
             # Lose reputation if company is doing worse (but keep some personal rep)
-            self.reputation = max(target, self.reputation - 0.25)
+            reputation -= 0.25
+            self.reputation = reputation if reputation > target else target
     
     # === BUSINESS SKILL EFFECTS ===
     def get_sponsor_deal_multiplier(self):
         """Higher business skill = better sponsor deals."""
         # Skill 2: 0.85x, Skill 5: 1.0x, Skill 10: 1.25x
-        return 0.7 + (self.business * 0.055)
+        return _SPONSOR_MULT[self.business]
     
     def get_purchase_discount(self):
         """Higher business skill = better prices when buying equipment."""
         # Skill 2: 0%, Skill 5: 6%, Skill 10: 16%
-        return (self.business - 2) * 0.02
+        return _PURCHASE_DISCOUNT[self.business]
     
     # === LEADERSHIP SKILL EFFECTS ===
     def get_morale_bonus(self):
         """Higher leadership = better driver/mechanic morale."""
         # Skill 2: 0, Skill 5: +3%, Skill 10: +8%
-        return (self.leadership - 2) * 0.01
+        return _MORALE_BONUS[self.leadership]
     
     def get_mechanic_bonus(self):
         """Higher leadership = more effective mechanics."""
         # Skill 2: 0, Skill 5: +0.3, Skill 10: +0.8
-        return (self.leadership - 2) * 0.1
+        return _MECHANIC_BONUS[self.leadership]
 
     def get_age(self, current_year):
         """Calculate player's current age."""
@@ -208,7 +240,11 @@ class PlayerCharacter:
         if not self.is_alive:
             return False
         
-        age = self.get_age(current_year)
+        age = current_year - self.birth_year
+        
+        # Nothing can happen before 80
+        if age < 80:
+            return False
         
         # Guaranteed death at 100
         if age >= 100:
@@ -218,33 +254,45 @@ class PlayerCharacter:
             return True
         
         # Health-based chance of death after 80
-        if age >= 80:
-            import random
-            # Lower health = higher death chance
-            # At age 80 with health 10: ~5% chance
-            # At age 95 with health 1: ~50% chance
-            death_chance = ((age - 75) * 0.02) * (1.1 - self.health * 0.1)
-            if random.random() < death_chance:
-                self.is_alive = False
-                self.death_year = current_year
-                self.death_reason = "health"
-                return True
+        # Lower health = higher death chance
+        # At age 80 with health 10: ~5% chance
+        # At age 95 with health 1: ~50% chance
+        death_chance = ((age - 75) * 0.02) * (1.1 - self.health * 0.1)
+        if random.random() < death_chance:
+            self.is_alive = False
+            self.death_year = current_year
+            self.death_reason = "health"
+            return True
         
         return False
     
     def get_title(self, current_year):
         """Get appropriate title based on age."""
-        age = self.get_age(current_year)
-        if age < 25:
-            return "Young"
-        elif age < 40:
-            return ""
-        elif age < 55:
-            return "Experienced"
-        elif age < 70:
-            return "Veteran"
-        else:
-            return "Legendary"
+        return _AGE_TITLES[bisect_right(_AGE_TITLE_THRESHOLDS, self.get_age(current_year))]
+
+
+# One entry in DriverCareerHistory.race_results (position is None for a DNF)
+RaceResult = namedtuple(
+    "RaceResult",
+    "year week race position constructor points prize dnf dnf_reason wet hot",
+)
+
+
+# Starting values for a DriverCareerHistory.seasons entry
+_SEASON_TEMPLATE = {
+    "starts": 0,
+    "wins": 0,
+    "podiums": 0,
+    "points": 0,
+    "dnfs": 0,
+    "constructor": None,
+    "best_finish": None,
+}
+
+
+def _roll_streak(current, best):
+    """End a streak: returns (0, best including the streak just ended)."""
+    return 0, (current if current > best else best)
 
 
 class DriverCareerHistory:
@@ -252,6 +300,19 @@ class DriverCareerHistory:
     Detailed career history for a driver.
     Tracks every race result, team affiliations, championships, awards.
     """
+    __slots__ = (
+        "driver_name", "country", "total_starts", "total_wins", "total_podiums",
+        "total_poles", "total_dnfs", "total_points", "total_prize_money",
+        "best_finish", "race_results", "_results_by_year", "_results_by_team",
+        "team_history", "_current_stint", "current_team",
+        "current_team_start_year", "seasons", "championships",
+        "_championship_wins", "_best_championship_position", "awards",
+        "current_win_streak", "best_win_streak", "current_podium_streak",
+        "best_podium_streak", "current_points_streak", "best_points_streak",
+        "consecutive_finishes", "best_consecutive_finishes", "debut_year",
+        "debut_race", "retirement_year", "is_active", "_summary_cache",
+    )
+
     def __init__(self, driver_name, country="Unknown"):
         self.driver_name = driver_name
         self.country = country
@@ -266,12 +327,15 @@ class DriverCareerHistory:
         self.total_prize_money = 0
         self.best_finish = None
         
-        # Detailed race results: list of dicts
-        # Each: {year, week, race, position, constructor, points, prize, dnf, dnf_reason, wet, hot}
+        # Detailed race results: list of RaceResult tuples
         self.race_results = []
+        # Same results, grouped for per-year / per-team lookups
+        self._results_by_year = {}
+        self._results_by_team = {}
         
         # Team history: list of {constructor, start_year, end_year, wins, races}
         self.team_history = []
+        self._current_stint = None  # open entry in team_history, if any
         self.current_team = None
         self.current_team_start_year = None
         
@@ -280,6 +344,8 @@ class DriverCareerHistory:
         
         # Championships and awards
         self.championships = []  # list of {year, position, points, constructor}
+        self._championship_wins = 0
+        self._best_championship_position = None
         self.awards = []  # list of {year, award_type, details}
         
         # Streaks and records
@@ -297,10 +363,22 @@ class DriverCareerHistory:
         self.debut_race = None
         self.retirement_year = None
         self.is_active = True
+        
+        # get_career_summary() result, cleared by every recording method
+        self._summary_cache = None
     
     def record_race(self, year, week, race_name, position, constructor, points, prize, 
                     dnf=False, dnf_reason=None, wet=False, hot=False):
         """Record a single race result."""
+        self._summary_cache = None
+        
+        # A handful of team/race names repeat across every stored result
+        intern = sys.intern
+        if constructor is not None:
+            constructor = intern(constructor)
+        race_name = intern(race_name)
+        if dnf_reason is not None:
+            dnf_reason = intern(dnf_reason)
         
         # Update debut
         if self.debut_year is None:
@@ -309,71 +387,65 @@ class DriverCareerHistory:
         
         # Track team changes
         if constructor != self.current_team:
-            if self.current_team is not None:
+            if self._current_stint is not None:
                 # Close out previous team stint
-                for stint in self.team_history:
-                    if stint["constructor"] == self.current_team and stint["end_year"] is None:
-                        stint["end_year"] = year
+                self._current_stint["end_year"] = year
             
             # Start new team stint
-            self.team_history.append({
+            self._current_stint = {
                 "constructor": constructor,
                 "start_year": year,
                 "end_year": None,
                 "wins": 0,
                 "races": 0,
                 "points": 0
-            })
+            }
+            self.team_history.append(self._current_stint)
             self.current_team = constructor
             self.current_team_start_year = year
         
         # Update current team stats
-        for stint in self.team_history:
-            if stint["constructor"] == constructor and stint["end_year"] is None:
-                stint["races"] += 1
-                stint["points"] += points
-                if position == 1:
-                    stint["wins"] += 1
+        stint = self._current_stint
+        if stint is not None:
+            stint["races"] += 1
+            stint["points"] += points
+            if position == 1:
+                stint["wins"] += 1
         
         # Record the race result
-        result = {
-            "year": year,
-            "week": week,
-            "race": race_name,
-            "position": position,  # None if DNF
-            "constructor": constructor,
-            "points": points,
-            "prize": prize,
-            "dnf": dnf,
-            "dnf_reason": dnf_reason,
-            "wet": wet,
-            "hot": hot
-        }
+        result = RaceResult(
+            year, week, race_name, position, constructor, points, prize,
+            dnf, dnf_reason, wet, hot,
+        )
         self.race_results.append(result)
+        self._results_by_year.setdefault(year, []).append(result)
+        self._results_by_team.setdefault(constructor, []).append(result)
         
         # Update totals
         self.total_starts += 1
         self.total_points += points
         self.total_prize_money += prize
         
+        # Streaks are updated as locals and written back once
+        win_streak = self.current_win_streak
+        best_win = self.best_win_streak
+        podium_streak = self.current_podium_streak
+        best_podium = self.best_podium_streak
+        points_streak = self.current_points_streak
+        best_points = self.best_points_streak
+        
         if dnf:
             self.total_dnfs += 1
             # Reset finish streaks
-            if self.consecutive_finishes > self.best_consecutive_finishes:
-                self.best_consecutive_finishes = self.consecutive_finishes
-            self.consecutive_finishes = 0
+            self.consecutive_finishes, self.best_consecutive_finishes = _roll_streak(
+                self.consecutive_finishes, self.best_consecutive_finishes
+            )
             # Reset points streak if DNF with no points
             if points == 0:
-                if self.current_points_streak > self.best_points_streak:
-                    self.best_points_streak = self.current_points_streak
-                self.current_points_streak = 0
+                points_streak, best_points = _roll_streak(points_streak, best_points)
             # Reset podium and win streaks
-            if self.current_win_streak > self.best_win_streak:
-                self.best_win_streak = self.current_win_streak
-            if self.current_podium_streak > self.best_podium_streak:
-                self.best_podium_streak = self.current_podium_streak
-            self.current_win_streak = 0
-            self.current_podium_streak = 0
+            win_streak, best_win = _roll_streak(win_streak, best_win)
+            podium_streak, best_podium = _roll_streak(podium_streak, best_podium)
         else:
             self.consecutive_finishes += 1
             
@@ -385,48 +457,39 @@ class DriverCareerHistory:
             if position == 1:
                 self.total_wins += 1
                 self.total_podiums += 1
-                self.current_win_streak += 1
-                self.current_podium_streak += 1
+                win_streak += 1
+                podium_streak += 1
             elif position <= 3:
                 self.total_podiums += 1
-                self.current_podium_streak += 1
+                podium_streak += 1
                 # Reset win streak on non-win
-                if self.current_win_streak > self.best_win_streak:
-                    self.best_win_streak = self.current_win_streak
-                self.current_win_streak = 0
+                win_streak, best_win = _roll_streak(win_streak, best_win)
             else:
                 # Reset streaks on non-podium
-                if self.current_win_streak > self.best_win_streak:
-                    self.best_win_streak = self.current_win_streak
-                if self.current_podium_streak > self.best_podium_streak:
-                    self.best_podium_streak = self.current_podium_streak
-                self.current_win_streak = 0
-                self.current_podium_streak = 0
+                win_streak, best_win = _roll_streak(win_streak, best_win)
+                podium_streak, best_podium = _roll_streak(podium_streak, best_podium)
             
             # Points streak
             if points > 0:
-                self.current_points_streak += 1
+                points_streak += 1
             else:
-                if self.current_points_streak > self.best_points_streak:
-                    self.best_points_streak = self.current_points_streak
-                self.current_points_streak = 0
+                points_streak, best_points = _roll_streak(points_streak, best_points)
         
-        # Update season summary
-        if year not in self.seasons:
-            self.seasons[year] = {
-                "starts": 0,
-                "wins": 0,
-                "podiums": 0,
-                "points": 0,
-                "dnfs": 0,
-                "constructor": constructor,
-                "best_finish": None
-            }
+        self.current_win_streak = win_streak
+        self.best_win_streak = best_win
+        self.current_podium_streak = podium_streak
+        self.best_podium_streak = best_podium
+        self.current_points_streak = points_streak
+        self.best_points_streak = best_points
         
-        season = self.seasons[year]
+        # Update season summary
+        season = self.seasons.get(year)
+        if season is None:
+            season = self.seasons[year] = _SEASON_TEMPLATE.copy()
         season["starts"] += 1
         season["points"] += points
-        season["constructor"] = constructor  # Update to current (in case of mid-season change)
+        if season["constructor"] != constructor:
+            season["constructor"] = constructor  # Update to current (in case of mid-season change)
         
         if dnf:
             season["dnfs"] += 1
@@ -441,18 +504,22 @@ class DriverCareerHistory:
     
     def record_championship_result(self, year, position, points, constructor):
         """Record end-of-season championship standing."""
+        self._summary_cache = None
         self.championships.append({
             "year": year,
             "position": position,
             "points": points,
             "constructor": constructor
         })
+        if self._best_championship_position is None or position < self._best_championship_position:
+            self._best_championship_position = position
         
         if year in self.seasons:
             self.seasons[year]["championship_position"] = position
         
         # Award for championship win
         if position == 1:
+            self._championship_wins += 1
             self.awards.append({
                 "year": year,
                 "award_type": "Champion",
@@ -461,6 +528,7 @@ class DriverCareerHistory:
     
     def add_award(self, year, award_type, details):
         """Add a special award or achievement."""
+        self._summary_cache = None
         self.awards.append({
             "year": year,
             "award_type": award_type,
@@ -469,28 +537,31 @@ class DriverCareerHistory:
     
     def retire(self, year):
         """Mark driver as retired."""
+        self._summary_cache = None
         self.retirement_year = year
         self.is_active = False
         
         # Close out current team stint
-        if self.current_team is not None:
-            for stint in self.team_history:
-                if stint["constructor"] == self.current_team and stint["end_year"] is None:
-                    stint["end_year"] = year
+        if self._current_stint is not None:
+            self._current_stint["end_year"] = year
+            self._current_stint = None
     
     def get_results_for_year(self, year):
         """Get all race results for a specific year."""
-        return [r for r in self.race_results if r["year"] == year]
+        return list(self._results_by_year.get(year, ()))
     
     def get_results_for_team(self, constructor):
         """Get all race results for a specific team."""
-        return [r for r in self.race_results if r["constructor"] == constructor]
+        return list(self._results_by_team.get(constructor, ()))
     
     def get_career_summary(self):
         """Get a summary dict of career stats."""
+        if self._summary_cache is not None:
+            return dict(self._summary_cache)
+        
         years_active = len(self.seasons) if self.seasons else 0
         
-        return {
+        self._summary_cache = {
             "name": self.driver_name,
             "country": self.country,
             "years_active": years_active,
@@ -505,15 +576,24 @@ class DriverCareerHistory:
             "points": self.total_points,
             "prize_money": self.total_prize_money,
             "best_finish": self.best_finish,
-            "championships": len([c for c in self.championships if c["position"] == 1]),
-            "best_championship": min([c["position"] for c in self.championships]) if self.championships else None,
+            "championships": self._championship_wins,
+            "best_championship": self._best_championship_position,
             "teams": len(self.team_history),
             "best_win_streak": max(self.best_win_streak, self.current_win_streak),
             "best_podium_streak": max(self.best_podium_streak, self.current_podium_streak),
         }
+        return dict(self._summary_cache)
 
 
 class GarageState:
+    __slots__ = (
+        "level", "base_cost", "staff_count", "staff_salary",
+        "customer_parts_only", "r_and_d_enabled", "factory_team",
+        "mechanic_skill", "upgrade_level", "upgrades", "repair_discount",
+        "repair_speed_bonus", "mechanic_skill_bonus", "_benefits_cache",
+        "_benefits_key",
+    )
+
     def __init__(self):
         self.level = 0  # 0 = home shed, 1+ = upgraded facilities
         self.base_cost = 25  # weekly running cost
@@ -532,41 +612,55 @@ class GarageState:
         self.repair_speed_bonus = 0.0  # percentage faster repairs (0.0-1.0)
         self.mechanic_skill_bonus = 0  # additional mechanic skill from upgrades
 
+        # calculate_garage_benefits() result and the upgrades it was built from
+        self._benefits_cache = None
+        self._benefits_key = None
+
+    def _benefits(self):
+        """Upgrade benefits, recalculated only when the upgrade list changes."""
+        key = tuple(self.upgrades)
+        if self._benefits_cache is None or key != self._benefits_key:
+            self._benefits_cache = calculate_garage_benefits(self)
+            self._benefits_key = key
+        return self._benefits_cache
+
     def get_effective_mechanic_skill(self, state=None):
-        """Get total mechanic skill including upgrade bonuses and temporary bonuses."""
-        from gmr.constants import calculate_garage_benefits
-        benefits = calculate_garage_benefits(self)
-        skill = self.mechanic_skill + benefits["mechanic_skill_bonus"]
+        """
+        Get total mechanic skill including upgrade bonuses and any pending
+        temporary bonuses on state. Read-only; see consume_temp_bonuses().
+        """
+        skill = self.mechanic_skill + self._benefits()["mechanic_skill_bonus"]
 
         # Add temporary bonuses from weekly events
         if state:
-            if hasattr(state, 'temp_mechanic_bonus') and state.temp_mechanic_bonus != 0:
-                skill += state.temp_mechanic_bonus
-                # Clear the bonus after use
-                state.temp_mechanic_bonus = 0
-            if hasattr(state, 'temp_morale_bonus') and state.temp_morale_bonus != 0:
-                skill += state.temp_morale_bonus
-                # Clear the bonus after use
-                state.temp_morale_bonus = 0
+            skill += state.temp_mechanic_bonus + state.temp_morale_bonus
 
         return skill
 
+    def consume_temp_bonuses(self, state):
+        """Use up the temporary mechanic/morale bonuses. Returns the amount used."""
+        used = state.temp_mechanic_bonus + state.temp_morale_bonus
+        state.temp_mechanic_bonus = 0
+        state.temp_morale_bonus = 0
+        return used
+
     def get_repair_cost_multiplier(self):
         """Get multiplier for repair costs (lower = cheaper)."""
-        from gmr.constants import calculate_garage_benefits
-        benefits = calculate_garage_benefits(self)
+        benefits = self._benefits()
         discount = benefits["repair_discount"]
         return max(0.1, 1.0 - discount)  # Minimum 10% of original cost
 
     def get_repair_speed_multiplier(self):
         """Get multiplier for repair effectiveness (lower = faster/more effective)."""
-        from gmr.constants import calculate_garage_benefits
-        benefits = calculate_garage_benefits(self)
+        benefits = self._benefits()
         speed_bonus = benefits["repair_speed_bonus"]
         return max(0.1, 1.0 - speed_bonus)  # Minimum 10% of original work needed
 
 class GameState:
     def __init__(self):
+        # Save format version (see migrate_save)
+        self.save_version = SAVE_VERSION
+
         # =====================================================================
         # PLAYER CHARACTER - The person playing the game
         # =====================================================================
@@ -614,6 +708,9 @@ class GameState:
 
         self.news = []
         self.garage = GarageState()
+        # One-shot mechanic skill bonuses from weekly events
+        self.temp_mechanic_bonus = 0
+        self.temp_morale_bonus = 0
         self.driver_contract_races = 0
         self.driver_pay = 0
         # Injury system
@@ -729,7 +826,15 @@ class GameState:
         self.last_race_attendance_details = {}
 
     def reset_championship(self):
-        self.points = {d["name"]: 0 for d in drivers}
+        # drivers changes between seasons, so this can't be a cached template
+        self.points = dict.fromkeys([d["name"] for d in drivers], 0)
+
+    def get_or_create_history(self, name, country="Unknown"):
+        """Return the DriverCareerHistory for name, creating it on first use."""
+        history = self.driver_histories.get(name)
+        if history is None:
+            history = self.driver_histories[name] = DriverCareerHistory(name, country)
+        return history
 
 
 def record_season_championship_standings(state, year):
@@ -737,25 +842,24 @@ def record_season_championship_standings(state, year):
     Record end-of-season championship standings to all driver histories.
     Call this BEFORE reset_championship().
     """
-    if not hasattr(state, 'points') or not state.points:
+    if not state.points:
         return
     
-    if not hasattr(state, 'driver_histories'):
-        state.driver_histories = {}
+    # Sort drivers by points to get championship positions; drivers with
+    # no points are never recorded, so leave them out of the sort
+    standings = sorted(
+        ((name, pts) for name, pts in state.points.items() if pts > 0),
+        key=itemgetter(1),
+        reverse=True,
+    )
     
-    # Sort drivers by points to get championship positions
-    standings = sorted(state.points.items(), key=lambda x: -x[1])
+    # Driver name -> constructor (first entry wins, as the old scan did)
+    constructor_by_name = {
+        d.get("name"): d.get("constructor", "Independent") for d in reversed(drivers)
+    }
     
     for position, (driver_name, points) in enumerate(standings, start=1):
-        if points == 0:
-            continue  # Skip drivers with no points
-        
-        # Find driver's constructor
-        constructor = "Unknown"
-        for d in drivers:
-            if d.get("name") == driver_name:
-                constructor = d.get("constructor", "Independent")
-                break
+        constructor = constructor_by_name.get(driver_name, "Unknown")
         
         # Record to driver history if it exists
         if driver_name in state.driver_histories:
@@ -763,101 +867,122 @@ def record_season_championship_standings(state, year):
             history.record_championship_result(year, position, points, constructor)
 
 
-def ensure_state_fields(state) -> None:
-    """
-    Defensive: ensure common per-week / per-race trackers exist.
-    Safe to call at boot and at start of each week.
-    """
-    # Player character system (for old saves)
-    if not hasattr(state, "player_character"):
-        state.player_character = PlayerCharacter()
-        # Try to migrate old data if available
-        if hasattr(state, "player_constructor") and state.player_constructor:
-            state.player_character.companies_founded.append(state.player_constructor)
-            state.player_character.companies_managed.append(state.player_constructor)
-    
+# Bump (and add a _SAVE_MIGRATIONS step) whenever saved field names change
+SAVE_VERSION = 1
+
+# Bump whenever ensure_state_fields() learns about a new field, so states
+# stamped by an older version run the checks again
+_FIELDS_VERSION = 1
+
+# Plain defaults ensure_state_fields() fills in for fields an older save lacks
+_STATE_DEFAULTS = (
     # Company identity fields (for old saves)
-    if not hasattr(state, "company_founded_year"):
-        state.company_founded_year = 1947
-    if not hasattr(state, "company_founder"):
-        state.company_founder = state.player_character.name if hasattr(state, "player_character") else "Unknown"
-    if not hasattr(state, "is_player_owned"):
-        state.is_player_owned = True
-    
-    if not hasattr(state, "valdieri_spawned"):
-        state.valdieri_spawned = False
+    ("company_founded_year", 1947),
+    ("is_player_owned", True),
+
+    ("valdieri_spawned", False),
+    ("travel_paid_week", None),
+    ("tyre_sets", 1),
+    ("country", "UK"),   # optional: your team home base later
+
+    # --- numeric weekly trackers ---
+    ("last_week_prize_money", 0),
+    ("last_week_sponsor_money", 0),
 
-    # compatibility: old/new naming (prize/sponsor)
-    if not hasattr(state, "last_week_prize_income"):
-        state.last_week_prize_income = getattr(state, "last_week_prize_money", 0)
-    if not hasattr(state, "last_week_sponsor_income"):
-        state.last_week_sponsor_income = getattr(state, "last_week_sponsor_money", 0)
+    ("last_week_driver_pay", 0),
+    ("last_week_purchases", 0),
+    ("last_week_rd_spend", 0),
+    ("last_week_running_costs", 0),
+    ("last_week_net", 0),
 
-    # compatibility: R&D naming (YOU currently use last_week_rnd in __init__)
-    if not hasattr(state, "last_week_rnd"):
-        state.last_week_rnd = getattr(state, "last_week_rd_spend", 0)
-    if not hasattr(state, "last_week_rd_spend"):
-        state.last_week_rd_spend = getattr(state, "last_week_rnd", 0)
+    # NEW buckets
+    ("last_week_travel_cost", 0),
+    ("last_week_appearance_income", 0),
 
-    if not hasattr(state, "last_week_travel_cost"):
-        state.last_week_travel_cost = 0
-    if not hasattr(state, "last_week_appearance_income"):
-        state.last_week_appearance_income = 0
-    if not hasattr(state, "travel_paid_week"):
-        state.travel_paid_week = None
+    # one-shot garage bonuses
+    ("temp_mechanic_bonus", 0),
+    ("temp_morale_bonus", 0),
 
-    if not hasattr(state, "tyre_sets"):
-        state.tyre_sets = 1
+    # --- sponsor placeholders ---
+    ("sponsor_contract", None),
+    ("sponsor_paid_this_week", False),
+    ("gallant_driver_promo_done", False),
 
+    # Tyre sponsor fields
+    ("tyre_sponsor_active", False),
+    ("tyre_sponsor_name", None),
+    ("tyre_sponsor_offer_seen_year", 0),
+)
 
-    if not hasattr(state, "country"):
-        state.country = "UK"   # optional: your team home base later
 
-    # --- numeric weekly trackers ---
-    for name, default in [
-        ("last_week_prize_money", 0),
-        ("last_week_sponsor_money", 0),
+# Containers ensure_state_fields() creates (fresh per state) when missing or None
+_STATE_CONTAINER_DEFAULTS = (
+    ("completed_races_by_year", dict),
+    ("podiums_by_year", dict),
+    ("race_history", list),
+    ("driver_career", dict),
+    ("driver_histories", dict),  # Detailed driver career histories
+    ("season_points", dict),   # even if championship inactive
+)
+
 
-        ("last_week_driver_pay", 0),
-        ("last_week_purchases", 0),
-        ("last_week_rd_spend", 0),
-        ("last_week_running_costs", 0),
-        ("last_week_net", 0),
+def ensure_state_fields(state) -> None:
+    """
+    Defensive: ensure common per-week / per-race trackers exist.
+    Safe to call at boot and at start of each week. Renamed fields from
+    older saves are handled once, on load, by migrate_save().
+    """
+    # GameState has no properties, so its __dict__ is the whole story
+    sd = state.__dict__
 
-        # NEW buckets
-        ("last_week_travel_cost", 0),
-        ("last_week_appearance_income", 0),
-    ]:
+    # Nothing can go missing once a state has been brought up to date
+    if sd.get("_fields_version", 0) >= _FIELDS_VERSION:
+        return
 
-        if not hasattr(state, name):
-            setattr(state, name, default)
+    setdefault = sd.setdefault
+    for name, default in _STATE_DEFAULTS:
+        setdefault(name, default)
 
     # --- dictionaries / history containers ---
-    for name, default in [
-        ("completed_races_by_year", {}),
-        ("podiums_by_year", {}),
-        ("race_history", []),
-        ("driver_career", {}),
-        ("driver_histories", {}),  # Detailed driver career histories
-        ("season_points", {}),   # even if championship inactive
-    ]:
-        if not hasattr(state, name) or getattr(state, name) is None:
-            setattr(state, name, default)
+    for name, factory in _STATE_CONTAINER_DEFAULTS:
+        if sd.get(name) is None:
+            sd[name] = factory()
 
-    # --- sponsor placeholders ---
-    if not hasattr(state, "sponsor_contract"):
-        state.sponsor_contract = None
-    if not hasattr(state, "sponsor_paid_this_week"):
-        state.sponsor_paid_this_week = False
+    sd["_fields_version"] = _FIELDS_VERSION
 
-    if not hasattr(state, "gallant_driver_promo_done"):
-        state.gallant_driver_promo_done = False
 
-    # Tyre sponsor fields
-    if not hasattr(state, "tyre_sponsor_active"):
-        state.tyre_sponsor_active = False
-    if not hasattr(state, "tyre_sponsor_name"):
-        state.tyre_sponsor_name = None
-    if not hasattr(state, "tyre_sponsor_offer_seen_year"):
-        state.tyre_sponsor_offer_seen_year = 0
+def _migrate_v1(saved):
+    """Pre-versioned saves: create the player character, copy renamed fields."""
+    # Player character system
+    if "player_character" not in saved and saved.get("player_constructor"):
+        player_character = PlayerCharacter()
+        player_character.companies_founded.append(saved["player_constructor"])
+        player_character.companies_managed.append(saved["player_constructor"])
+        saved["player_character"] = player_character
+
+    # old/new naming (prize/sponsor)
+    if "last_week_prize_income" not in saved:
+        saved["last_week_prize_income"] = saved.get("last_week_prize_money", 0)
+    if "last_week_sponsor_income" not in saved:
+        saved["last_week_sponsor_income"] = saved.get("last_week_sponsor_money", 0)
+
+    # R&D naming (last_week_rnd is the current name)
+    if "last_week_rnd" not in saved:
+        saved["last_week_rnd"] = saved.get("last_week_rd_spend", 0)
+    if "last_week_rd_spend" not in saved:
+        saved["last_week_rd_spend"] = saved.get("last_week_rnd", 0)
+
 
+# One entry per SAVE_VERSION step: _SAVE_MIGRATIONS[v] upgrades v -> v + 1
+_SAVE_MIGRATIONS = (_migrate_v1,)
+
+
+def migrate_save(saved):
+    """
+    Bring the "state" dict from a save file up to SAVE_VERSION, in place,
+    before it is merged into a GameState. Returns the same dict.
+    """
+    for migrate in _SAVE_MIGRATIONS[saved.get("save_version", 0):]:
+        migrate(saved)
+    saved["save_version"] = SAVE_VERSION
+    return saved
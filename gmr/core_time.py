@@ -1,4 +1,6 @@
 # gmr/core_time
+from functools import lru_cache
+
 from gmr.constants import WEEKS_PER_YEAR
 
 
@@ -19,7 +21,26 @@ class GameTime:
                 self.month = 0
                 self.year += 1
 
+    @property
+    def week_table(self):
+        """Season week -> (month, week) for this year (shared, cached per year)."""
+        return build_week_table(self.year)
+
+
+@lru_cache(maxsize=8)
+def build_week_table(year):
+    """
+    Season week -> (month, week) for a year, stepped once and cached.
+    Shared by every GameTime for that year, including throwaway copies.
+    """
+    temp = GameTime(year)
+    out = [(temp.month, temp.week)]  # week 0 displays like week 1
+    for _ in range(WEEKS_PER_YEAR):
+        out.append((temp.month, temp.week))
+        temp.advance_week()
+    return tuple(out)
+
 
-def get_season_week(time):
+def get_season_week(time, _weeks=WEEKS_PER_YEAR):
     """Convert absolute_week into 1..WEEKS_PER_YEAR so the calendar repeats each year."""
-    return ((time.absolute_week - 1) % WEEKS_PER_YEAR) + 1
+    return ((time.absolute_week - 1) % _weeks) + 1
@@ -6,6 +6,7 @@ from gmr.constants import MONTHS, WEATHER_WET_CHANCE
 from gmr.data import tracks
 from gmr.core_time import get_season_week
 from gmr.calendar import generate_calendar_for_year, get_clashes_for_year
+from gmr.careers import driver_stat_sum
 from gmr.race_engine import run_ai_only_race, simulate_qualifying, run_race, roll_race_weather
 
 
@@ -160,13 +161,7 @@ def handle_contract_end_after_race(state):
     print(f"\nYou sit down with {d['name']} to discuss a fresh contract.")
 
     # Re-use your hire logic: stats + fame → pay
-    stat_sum = (
-        d["pace"]
-        + d["consistency"]
-        + d["aggression"]
-        + d["mechanical_sympathy"]
-        + d["wet_skill"]
-    )
+    stat_sum = driver_stat_sum(d)
     fame = d.get("fame", 0)
 
     base_pay = stat_sum * 2
@@ -491,7 +486,7 @@ def handle_race_week(state, time):
         return
 
     # ✅ HARD GUARD: never run the same race twice
-    if not hasattr(state, "completed_races") or state.completed_races is None:
+    if state.__dict__.get("completed_races") is None:
         state.completed_races = set()
 
     if season_week in state.completed_races:
@@ -612,9 +607,7 @@ def handle_race_week(state, time):
                             if state.money >= transport_cost:
                                 state.money -= transport_cost
                                 state.last_week_travel_cost += transport_cost
-                                if not hasattr(state, 'transport_paid_races'):
-                                    state.transport_paid_races = set()
-                                state.transport_paid_races.add(race_name)
+                                state.__dict__.setdefault('transport_paid_races', set()).add(race_name)
                                 state.news.append(f"Paid £{transport_cost} for international transport to {race_name}.")
                                 print(f"Paid £{transport_cost}. Proceeding to the race.")
                             else:
@@ -647,9 +640,7 @@ def handle_race_week(state, time):
                             if state.money >= transatlantic_cost:
                                 state.money -= transatlantic_cost
                                 state.last_week_travel_cost += transatlantic_cost
-                                if not hasattr(state, 'transport_paid_races'):
-                                    state.transport_paid_races = set()
-                                state.transport_paid_races.add(race_name)
+                                state.__dict__.setdefault('transport_paid_races', set()).add(race_name)
                                 state.news.append(f"Paid £{transatlantic_cost} for transatlantic transport to {race_name}.")
                                 print(f"Paid £{transatlantic_cost}. Proceeding to the race.")
                             else:
@@ -16,9 +16,7 @@ from gmr.constants import (
 from gmr.data import drivers, tracks, constructors, engines, chassis_list
 from gmr.world_logic import driver_enters_event, get_car_speed_for_track, calculate_car_speed
 from gmr.careers import (
-    update_fame_after_race,
-    update_driver_progress,
-    grant_participation_xp_for_dnfs,
+    apply_post_race_effects,
     tick_driver_contract_after_race_end,
 )
 from gmr.story import maybe_trigger_demo_finale
@@ -53,6 +51,10 @@ class RaceSimulator:
         self.grid_risk_mult = grid_risk_mult
         self.race_length_factor = race_length_factor
         
+        # Era multipliers are fixed for the whole race
+        self.reliability_mult = get_reliability_mult(time)
+        self.crash_mult = get_crash_mult(time)
+        
         # Initialize positions from qualifying
         if quali_results:
             self.current_positions = [d for d, _ in quali_results if d in event_grid]
@@ -87,8 +89,8 @@ class RaceSimulator:
     def _precompute_incidents(self):
         """Pre-determine which AI drivers will have incidents and in which stage."""
         incidents = {}
-        reliability_mult = get_reliability_mult(self.time)
-        crash_mult = get_crash_mult(self.time)
+        reliability_mult = self.reliability_mult
+        crash_mult = self.crash_mult
         
         for d in self.event_grid:
             if d == self.game_state.player_driver:
@@ -263,7 +265,7 @@ class RaceSimulator:
             mech = player.get("mechanical_sympathy", 5)
             
             # Base engine failure chance per stage (calibrated for 1940s racing)
-            reliability_mult = get_reliability_mult(self.time)
+            reliability_mult = self.reliability_mult
             base_engine_fail = (11 - car_reliability) * 0.012 * reliability_mult  # Reduced from 0.025
             base_engine_fail *= (1 + (5 - mech) * 0.06)  # Reduced from 0.08
             base_engine_fail *= self.track_profile.get("engine_danger", 1.0)
@@ -286,7 +288,7 @@ class RaceSimulator:
             aggression = player.get("aggression", 5)
             wet_skill = player.get("wet_skill", 5)
             
-            crash_mult = get_crash_mult(self.time)
+            crash_mult = self.crash_mult
             base_crash = (11 - consistency) * 0.008 * crash_mult  # Reduced from 0.012
             base_crash *= (1 + (aggression - 5) * 0.06)  # Reduced from 0.08
             base_crash *= self.track_profile.get("crash_danger", 1.0)
@@ -866,10 +868,9 @@ def choose_stage_strategy(stage_label, is_wet, is_hot, state=None):
 
     # Track cumulative wear from stage choices
     if state is not None:
-        if not hasattr(state, 'stage_wear_accumulator'):
-            state.stage_wear_accumulator = 0.0
-        if not hasattr(state, 'stage_count'):
-            state.stage_count = 0
+        sd = state.__dict__
+        sd.setdefault('stage_wear_accumulator', 0.0)
+        sd.setdefault('stage_count', 0)
         state.stage_count += 1
 
     if choice == "1":
@@ -1808,8 +1809,7 @@ def pay_appearance_money(state, race_name):
         payout = min(payout, 100)
 
     # Track appearance money separately from prize money
-    if not hasattr(state, "last_week_appearance_income"):
-        state.last_week_appearance_income = 0
+    state.__dict__.setdefault("last_week_appearance_income", 0)
 
     state.money += payout
     state.last_week_income += payout
@@ -1976,15 +1976,14 @@ def record_race_result(state, time, season_week, race_name, is_wet, is_hot, fini
     finishers: list of (driver_dict, performance)
     retired: list of (driver_dict, reason) where reason is "engine" or "crash" (or "unknown")
     """
-    from gmr.core_state import DriverCareerHistory
-
     # Safety for old saves
-    if not hasattr(state, "race_history") or state.race_history is None:
-        state.race_history = []
-    if not hasattr(state, "driver_career") or state.driver_career is None:
-        state.driver_career = {}
-    if not hasattr(state, "driver_histories") or state.driver_histories is None:
-        state.driver_histories = {}
+    sd = state.__dict__
+    if sd.get("race_history") is None:
+        sd["race_history"] = []
+    if sd.get("driver_career") is None:
+        sd["driver_career"] = {}
+    if sd.get("driver_histories") is None:
+        sd["driver_histories"] = {}
 
     entry = {
         "year": time.year,
@@ -2047,10 +2046,7 @@ def record_race_result(state, time, season_week, race_name, is_wet, is_hot, fini
         state.driver_career[name] = c
         
         # Update detailed driver history
-        if name not in state.driver_histories:
-            state.driver_histories[name] = DriverCareerHistory(name, country)
-        
-        history = state.driver_histories[name]
+        history = state.get_or_create_history(name, country)
         history.record_race(
             year=time.year,
             week=season_week,
@@ -2100,10 +2096,7 @@ def record_race_result(state, time, season_week, race_name, is_wet, is_hot, fini
         state.driver_career[name] = c
         
         # Update detailed driver history
-        if name not in state.driver_histories:
-            state.driver_histories[name] = DriverCareerHistory(name, country)
-        
-        history = state.driver_histories[name]
+        history = state.get_or_create_history(name, country)
         history.record_race(
             year=time.year,
             week=season_week,
@@ -2296,7 +2289,6 @@ def run_ai_only_race(state, race_name, time, season_week, track_profile):
             reliability = max(1, ctor_reliability)
             mech = d.get("mechanical_sympathy", 5)
 
-            reliability_mult = get_reliability_mult(time)
             race_distance_km = track_profile.get("race_distance_km", 250.0)
             race_length_factor = race_distance_km / 250.0
 
@@ -2404,9 +2396,11 @@ def run_ai_only_race(state, race_name, time, season_week, track_profile):
     fame_mult = track_profile.get("fame_mult", 1.0)
     xp_mult = track_profile.get("xp_mult", 1.0)
 
-    update_fame_after_race(
+    apply_post_race_effects(
+        state,
         finishers,
         fame_mult=fame_mult,
+        xp_mult=xp_mult,
         race_name=race_name,
         season_week=season_week,
         year=time.year
@@ -2416,8 +2410,6 @@ def run_ai_only_race(state, race_name, time, season_week, track_profile):
     from gmr.sponsorship import maybe_gallant_driver_promo
     maybe_gallant_driver_promo(state, time)
 
-    update_driver_progress(state, finishers, time, xp_mult=xp_mult)
-
     # Championship points (finishers only)
     if CHAMPIONSHIP_ACTIVE:
         for pos, (d, _) in enumerate(finishers):
@@ -3054,21 +3046,22 @@ def run_race(state, race_name, time, season_week, grid_bonus, is_wet, is_hot):
     fame_mult = track_profile.get("fame_mult", 1.0)
     xp_mult = track_profile.get("xp_mult", 1.0)
 
-    update_fame_after_race(
+    finisher_xp, dnf_xp = apply_post_race_effects(
+        state,
         finishers,
+        dnf_drivers,
         fame_mult=fame_mult,
+        xp_mult=xp_mult,
         race_name=race_name,
         season_week=season_week,
         year=time.year
     )
+    player_xp_gain = finisher_xp + dnf_xp
 
     # Sponsor story event: driver promo at Fame 2+
     from gmr.sponsorship import maybe_gallant_driver_promo
     maybe_gallant_driver_promo(state, time)
 
-    player_xp_gain = update_driver_progress(state, finishers, time, xp_mult=xp_mult)
-    player_xp_gain += grant_participation_xp_for_dnfs(state, dnf_drivers, time, xp_mult=xp_mult)
-
     # ------------------------------
     # CHAMPIONSHIP POINTS + PRIZE MONEY
     # ------------------------------
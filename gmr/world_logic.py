@@ -1,5 +1,6 @@
 # gmr/world_logic.py
 import random
+from functools import lru_cache
 from gmr.data import drivers, constructors
 
 
@@ -294,6 +295,7 @@ def get_regen_age_for_year(year: int) -> int:
         # Proper modern era – young hotshoes
         return random.randint(18, 30)
 
+@lru_cache(maxsize=128)
 def get_retirement_ages_for_year(year: int):
     """
     Returns (soft_retire_age, hard_retire_age) for that era.
@@ -46,7 +46,7 @@ from gmr.ui_business import can_do_pr_trip
 from gmr.ui_world import show_world_economy
 from gmr.ui_career import show_career_menu, show_player_status_brief
 from gmr.calendar import generate_calendar_for_year
-from gmr.core_state import ensure_state_fields
+from gmr.core_state import ensure_state_fields, migrate_save
 
 def save_game(state, time):
     os.makedirs("saves", exist_ok=True)
@@ -67,8 +67,10 @@ def load_game(state, time):
     if filename and os.path.exists(f"saves/{filename}.json"):
         with open(f"saves/{filename}.json", "r") as f:
             data = json.load(f)
-        state.__dict__.update(data["state"])
+        state.__dict__.update(migrate_save(data["state"]))
         time.__dict__.update(data["time"])
+        # Re-check fields against whatever the save was written with
+        state.__dict__.pop("_fields_version", None)
         print(f"Game loaded from saves/{filename}.json")
     else:
         print("Save file not found.")
@@ -770,6 +772,7 @@ def run_game():
 
                         # Progress increases each week based on mechanic skill, with randomness.
                         weekly_gain = random.uniform(0.3, 1.0) * state.garage.get_effective_mechanic_skill(state) * 2.0
+                        state.garage.consume_temp_bonuses(state)
                         state.chassis_progress += weekly_gain
 
                         # Enough progress for a breakthrough?
@@ -1,12 +1,19 @@
 """Tests for calendar.py - Calendar generation and race scheduling."""
 
+from collections.abc import Mapping
+
+import pytest
+
+import gmr.calendar
 from gmr.calendar import (
     generate_calendar_for_year,
+    format_week_date,
     get_race_tier,
     BIG_RACES,
     MEDIUM_RACES,
     SMALL_RACES
 )
+from gmr.core_time import GameTime
 
 
 class TestGetRaceTier:
@@ -39,8 +46,8 @@ class TestGenerateCalendarForYear:
         """Test calendar generation for inaugural 1947 season."""
         calendar = generate_calendar_for_year(1947)
         
-        # Should return a dictionary
-        assert isinstance(calendar, dict)
+        # Should return a read-only week -> race mapping
+        assert isinstance(calendar, Mapping)
         
         # Should have some races
         assert len(calendar) > 0
@@ -96,6 +103,28 @@ class TestGenerateCalendarForYear:
         # Should generate identical calendars
         assert calendar1 == calendar2
     
+    def test_generate_calendar_is_cached_and_read_only(self):
+        """Test that repeat calls share one read-only calendar."""
+        calendar1 = generate_calendar_for_year(1960)
+        calendar2 = generate_calendar_for_year(1960)
+
+        assert calendar1 is calendar2
+        with pytest.raises(TypeError):
+            calendar1[1] = "Bradley Fields"
+
+    def test_generate_calendar_single_shuffle_mode(self, monkeypatch):
+        """Test that single-shuffle mode still builds valid, deterministic seasons."""
+        monkeypatch.setattr(gmr.calendar, "CALENDAR_SINGLE_SHUFFLE", True)
+        monkeypatch.setattr(gmr.calendar, "_year_clashes", {})
+
+        for year in (1947, 1955):
+            calendar = gmr.calendar._generate_calendar_for_year_impl(year)
+            assert calendar == gmr.calendar._generate_calendar_for_year_impl(year)
+            assert calendar.get(20) == "Vallone GP"
+            assert calendar.get(40) == "Ardennes Endurance GP"
+            for week in calendar.keys():
+                assert 9 <= week <= 40
+
     def test_generate_calendar_different_years_vary(self):
         """Test that different years produce different calendars."""
         calendar1 = generate_calendar_for_year(1955)
@@ -135,3 +164,19 @@ class TestGenerateCalendarForYear:
         # Should appear at least once (at week 20), possibly twice
         assert vallone_count >= 1
         assert vallone_count <= 2
+
+
+class TestFormatWeekDate:
+    """Test suite for season-week date labels."""
+
+    def test_format_week_date_first_week(self):
+        """Test that week 1 is the first week of January."""
+        assert format_week_date(GameTime(1950), 1) == "Week 1, January"
+
+    def test_format_week_date_month_rollover(self):
+        """Test that week 5 rolls into February."""
+        assert format_week_date(GameTime(1950), 5) == "Week 1, February"
+
+    def test_format_week_date_season_finale(self):
+        """Test the Ardennes finale week label."""
+        assert format_week_date(GameTime(1950), 40) == "Week 4, October"
@@ -8,8 +8,13 @@ from gmr.constants import (
     get_reliability_mult,
     get_crash_mult,
     get_prize_for_race_and_pos,
-    DEFAULT_PRIZE_TOP3
+    get_era_name,
+    get_era_speed_factor,
+    DEFAULT_PRIZE_TOP3,
+    calculate_garage_benefits,
+    get_available_garage_upgrades,
 )
+from gmr.core_state import GarageState
 from gmr.core_time import GameTime
 
 
@@ -103,6 +108,25 @@ class TestGetCrashMult:
         assert mult_1990 >= mult_2015
 
 
+class TestEraLookups:
+    """Test era name and speed lookups."""
+
+    def test_era_name_boundaries(self):
+        """Test that each era starts on its boundary year."""
+        assert get_era_name(1949) == "Post-War Revival"
+        assert get_era_name(1950) == "Golden Age"
+        assert get_era_name(1959) == "Golden Age"
+        assert get_era_name(1960) == "Sponsorship Era"
+        assert get_era_name(2025) == "Future Racing"
+
+    def test_era_speed_factor_increases(self):
+        """Test that speed never decreases over time."""
+        speeds = [get_era_speed_factor(y) for y in range(1940, 2040)]
+        assert speeds == sorted(speeds)
+        assert get_era_speed_factor(1947) == 1.0
+        assert get_era_speed_factor(2030) == 2.3
+
+
 class TestGetPrizeForRaceAndPos:
     """Test suite for prize money calculation."""
     
@@ -170,3 +194,36 @@ class TestGetPrizeForRaceAndPos:
         
         # Should get finisher bonus (50)
         assert prize_4th == 50
+
+
+class TestGarageUpgrades:
+    """Test garage upgrade availability and benefits."""
+
+    def test_prerequisites_gate_availability(self):
+        """Test that upgrades unlock only once their prerequisites are owned."""
+        garage = GarageState()
+        available = get_available_garage_upgrades(garage, 1950)
+        assert "basic_workshop" in available
+        assert "advanced_tools" not in available
+
+        garage.upgrades.append("basic_workshop")
+        available = get_available_garage_upgrades(garage, 1950)
+        assert "basic_workshop" not in available
+        assert "advanced_tools" in available
+        assert "repair_specialization" in available
+
+    def test_year_gates_availability(self):
+        """Test that upgrades are hidden before their year."""
+        garage = GarageState()
+        garage.upgrades = ["basic_workshop", "advanced_tools"]
+        assert "research_facility" not in get_available_garage_upgrades(garage, 1954)
+        assert "research_facility" in get_available_garage_upgrades(garage, 1955)
+
+    def test_benefits_stack(self):
+        """Test that benefits from several upgrades add together."""
+        garage = GarageState()
+        garage.upgrades = ["basic_workshop", "advanced_tools", "research_facility"]
+        benefits = calculate_garage_benefits(garage)
+        assert benefits["repair_discount"] == 0.1 + 0.15
+        assert benefits["mechanic_skill_bonus"] == 2
+        assert benefits["r_and_d_enabled"] is True
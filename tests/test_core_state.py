@@ -1,6 +1,15 @@
 """Tests for core_state.py - GameState and PlayerCharacter classes."""
 
-from gmr.core_state import GameState, PlayerCharacter
+from gmr.core_state import (
+    DriverCareerHistory,
+    GameState,
+    GarageState,
+    PlayerCharacter,
+    SAVE_VERSION,
+    ensure_state_fields,
+    migrate_save,
+    record_season_championship_standings,
+)
 
 
 class TestPlayerCharacter:
@@ -93,6 +102,19 @@ class TestPlayerCharacter:
         assert player.business == initial_level + 1
 
 
+    def test_check_death_by_age(self):
+        """Test that death cannot happen young and is certain at 100."""
+        player = PlayerCharacter()
+        player.health = 0
+        assert player.check_death(player.birth_year + 79) is False
+        assert player.is_alive is True
+
+        assert player.check_death(player.birth_year + 100) is True
+        assert player.is_alive is False
+        assert player.death_reason == "old_age"
+        assert player.check_death(player.birth_year + 101) is False
+
+
 class TestGameState:
     """Test suite for GameState class."""
     
@@ -171,3 +193,166 @@ class TestGameState:
         assert state.player_driver_injured is True
         assert state.player_driver_injury_weeks_remaining == 3
         assert state.player_driver_injury_severity == 5
+
+
+class TestDriverCareerHistory:
+    """Test suite for DriverCareerHistory class."""
+
+    def test_team_stints_follow_constructor_changes(self):
+        """Test that stints open, accumulate and close on team changes."""
+        history = DriverCareerHistory("Test Driver")
+        history.record_race(1950, 5, "Vallone GP", 1, "Scuderia Valdieri", 8, 500)
+        history.record_race(1950, 9, "Marblethorpe GP", 3, "Scuderia Valdieri", 4, 150)
+        history.record_race(1951, 5, "Vallone GP", 2, "Enzoni", 6, 250)
+
+        first, second = history.team_history
+        assert first["constructor"] == "Scuderia Valdieri"
+        assert first["races"] == 2
+        assert first["wins"] == 1
+        assert first["points"] == 12
+        assert first["end_year"] == 1951
+        assert second["constructor"] == "Enzoni"
+        assert second["races"] == 1
+        assert second["end_year"] is None
+
+    def test_retire_closes_current_stint(self):
+        """Test that retiring closes the open stint and stops it counting."""
+        history = DriverCareerHistory("Test Driver")
+        history.record_race(1950, 5, "Vallone GP", 4, "Enzoni", 3, 0)
+        history.retire(1952)
+        history.record_race(1953, 5, "Vallone GP", 1, "Enzoni", 8, 500)
+
+        assert len(history.team_history) == 1
+        assert history.team_history[0]["end_year"] == 1952
+        assert history.team_history[0]["races"] == 1
+
+    def test_results_for_year_and_team(self):
+        """Test per-year and per-team result lookups."""
+        history = DriverCareerHistory("Test Driver")
+        history.record_race(1950, 5, "Vallone GP", 1, "Enzoni", 8, 500)
+        history.record_race(1951, 5, "Vallone GP", 2, "Enzoni", 6, 250)
+        history.record_race(1951, 9, "Marblethorpe GP", None, "Scuderia Valdieri", 0, 0, dnf=True)
+
+        assert [r.week for r in history.get_results_for_year(1951)] == [5, 9]
+        assert [r.year for r in history.get_results_for_team("Enzoni")] == [1950, 1951]
+        assert history.get_results_for_year(1949) == []
+
+    def test_career_summary_championships(self):
+        """Test championship counts in the career summary."""
+        history = DriverCareerHistory("Test Driver")
+        assert history.get_career_summary()["best_championship"] is None
+
+        history.record_championship_result(1950, 3, 12, "Enzoni")
+        history.record_championship_result(1951, 1, 30, "Enzoni")
+        history.record_championship_result(1952, 1, 28, "Enzoni")
+
+        summary = history.get_career_summary()
+        assert summary["championships"] == 2
+        assert summary["best_championship"] == 1
+
+    def test_career_summary_refreshes_after_race(self):
+        """Test that a cached summary picks up newly recorded races."""
+        history = DriverCareerHistory("Test Driver")
+        history.record_race(1950, 5, "Vallone GP", 1, "Enzoni", 8, 500)
+        assert history.get_career_summary()["wins"] == 1
+
+        history.record_race(1950, 9, "Marblethorpe GP", 1, "Enzoni", 8, 400)
+        summary = history.get_career_summary()
+        assert summary["wins"] == 2
+        assert summary["starts"] == 2
+
+
+class TestGarageState:
+    """Test suite for GarageState class."""
+
+    def test_multipliers_follow_upgrades(self):
+        """Test that repair multipliers update as upgrades are added or reset."""
+        garage = GarageState()
+        assert garage.get_repair_cost_multiplier() == 1.0
+
+        garage.upgrades.append("basic_workshop")
+        assert garage.get_repair_cost_multiplier() == 0.9
+        assert garage.get_effective_mechanic_skill() == garage.mechanic_skill + 1
+
+        garage.upgrades = []
+        assert garage.get_repair_cost_multiplier() == 1.0
+
+    def test_temp_bonuses_apply_until_consumed(self):
+        """Test that temporary mechanic bonuses count until explicitly consumed."""
+        state = GameState()
+        base = state.garage.get_effective_mechanic_skill(state)
+        state.temp_mechanic_bonus = 2
+        assert state.garage.get_effective_mechanic_skill(state) == base + 2
+        assert state.garage.get_effective_mechanic_skill(state) == base + 2
+
+        assert state.garage.consume_temp_bonuses(state) == 2
+        assert state.temp_mechanic_bonus == 0
+        assert state.garage.get_effective_mechanic_skill(state) == base
+
+    def test_get_or_create_history(self):
+        """Test that driver histories are created once and then reused."""
+        state = GameState()
+        history = state.get_or_create_history("Test Driver", "UK")
+        assert history.country == "UK"
+        assert state.get_or_create_history("Test Driver") is history
+        assert state.driver_histories["Test Driver"] is history
+
+
+class TestRecordSeasonChampionshipStandings:
+    """Test end-of-season standings recording."""
+
+    def test_positions_skip_pointless_drivers(self):
+        """Test that scorers get positions and pointless drivers are skipped."""
+        state = GameState()
+        names = ["Driver A", "Driver B", "Driver C"]
+        state.points = {names[0]: 0, names[1]: 6, names[2]: 14}
+        for name in names:
+            state.get_or_create_history(name)
+
+        record_season_championship_standings(state, 1950)
+
+        assert state.driver_histories[names[2]].championships[0]["position"] == 1
+        assert state.driver_histories[names[1]].championships[0]["position"] == 2
+        assert state.driver_histories[names[0]].championships == []
+
+
+class TestEnsureStateFields:
+    """Test old-save field backfilling."""
+
+    def test_fills_missing_fields_once(self):
+        """Test that missing fields are added and later calls are skipped."""
+        state = GameState()
+        del state.tyre_sets
+        state.race_history = None
+        ensure_state_fields(state)
+        assert state.tyre_sets == 1
+        assert state.race_history == []
+
+        del state.tyre_sets
+        ensure_state_fields(state)
+        assert not hasattr(state, "tyre_sets")
+
+        state.__dict__.pop("_fields_version")
+        ensure_state_fields(state)
+        assert state.tyre_sets == 1
+
+
+class TestMigrateSave:
+    """Test save-file migrations."""
+
+    def test_unversioned_save_copies_renamed_fields(self):
+        """Test that old field names are carried over to the new ones."""
+        saved = {"last_week_prize_money": 120, "last_week_rd_spend": 40, "player_constructor": "Test Racing"}
+        migrate_save(saved)
+        assert saved["save_version"] == SAVE_VERSION
+        assert saved["last_week_prize_income"] == 120
+        assert saved["last_week_rnd"] == 40
+        assert saved["player_character"].companies_founded == ["Test Racing"]
+
+    def test_current_save_is_left_alone(self):
+        """Test that an up-to-date save is not touched by old migrations."""
+        saved = GameState().__dict__.copy()
+        saved["last_week_prize_income"] = 5
+        saved["last_week_prize_money"] = 99
+        migrate_save(saved)
+        assert saved["last_week_prize_income"] == 5
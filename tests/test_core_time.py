@@ -1,6 +1,6 @@
 """Tests for core_time.py - GameTime and time management."""
 
-from gmr.core_time import GameTime, get_season_week
+from gmr.core_time import GameTime, build_week_table, get_season_week
 from gmr.constants import WEEKS_PER_YEAR
 
 
@@ -84,6 +84,27 @@ class TestGameTime:
         
         assert time.absolute_week == 101
 
+    def test_week_table_maps_season_weeks(self):
+        """Test the season week -> (month, week) table."""
+        time = GameTime(1950)
+        table = time.week_table
+
+        assert table[1] == (0, 1)
+        assert table[5] == (1, 1)
+        assert table[WEEKS_PER_YEAR] == (11, 4)
+
+    def test_week_table_not_stored_on_instance(self):
+        """Test that the table stays out of the saved time fields."""
+        time = GameTime()
+        time.week_table
+
+        assert "week_table" not in vars(time)
+
+    def test_build_week_table_shared_per_year(self):
+        """Test that GameTime instances for one year share a single table."""
+        assert GameTime(1955).week_table is GameTime(1955).week_table
+        assert build_week_table(1955) is GameTime(1955).week_table
+
 
 class TestGetSeasonWeek:
     """Test suite for get_season_week function."""